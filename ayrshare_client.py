@@ -5,12 +5,18 @@ Provides async interface to Ayrshare's social media API.
 Handles authentication, request formatting, and error handling.
 """
 
+import asyncio
+import base64
 import os
-from typing import Any, Dict, List, Optional
+import random
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from datetime import datetime
 
 import httpx
-from pydantic import BaseModel, Field
+import ijson
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class AyrshareError(Exception):
@@ -30,6 +36,10 @@ class AyrshareValidationError(AyrshareError):
 
 class PostResponse(BaseModel):
     """Response from post creation/update operations"""
+    # Drop unknown platform-specific keys instead of storing them, and
+    # freeze instances so cached responses are safely shareable.
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     id: str
     status: str
     refId: Optional[str] = None
@@ -39,27 +49,185 @@ class PostResponse(BaseModel):
 
 class AnalyticsResponse(BaseModel):
     """Response from analytics queries"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     data: Dict[str, Any]
     platforms: Optional[List[str]] = None
 
 
+# Transient statuses worth retrying with backoff
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Methods safe to retry automatically; POST retries risk double-posting
+# and are gated behind the retry_posts opt-in.
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "PATCH", "DELETE"})
+
+# Read endpoints whose large, slow-changing responses are worth revalidating
+# with If-None-Match/If-Modified-Since (several Ayrshare reads use POST, so
+# this can't be keyed off the HTTP method alone).
+_CONDITIONAL_ENDPOINTS = frozenset({"/history", "/profiles", "/reviews", "/webhooks"})
+
+
+# Per-endpoint timeouts, precomputed as httpx.Timeout objects. Legitimately
+# slow operations (bulk posting, media uploads, large history pulls) get
+# generous budgets above the default; the 3s connect bound still fails dead
+# connections fast so they release their pool slot quickly.
+# _send passes an explicit timeout on every request, so the default budget
+# is derived from AYRSHARE_TIMEOUT here — the deployment knob
+# ProductionConfig documents — rather than on the (never-consulted)
+# client-wide setting. The fallback matches ProductionConfig's documented
+# 30s default so the health payload reports the budget actually in force.
+_DEFAULT_TIMEOUT = httpx.Timeout(float(os.getenv("AYRSHARE_TIMEOUT", "30")), connect=3.0)
+_TIMEOUTS = {
+    "/post/bulk": httpx.Timeout(60.0, connect=3.0),
+    "/media/upload": httpx.Timeout(120.0, connect=3.0),
+    "/history": httpx.Timeout(60.0, connect=3.0),
+}
+
+
+# Request-body serialization options: datetime values (scheduled_date etc.)
+# are emitted as strict RFC 3339 in C — naive datetimes treated as UTC and
+# rendered with a Z suffix — so callers can pass datetime objects without
+# pre-formatting them.
+_JSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+# Size bounds for the per-client caches. Keys include per-ID endpoints
+# (/post/{id}, /media/{id}, ...), so a long-lived server would otherwise
+# accumulate entries without limit — the validator cache in particular
+# retains full httpx.Response objects. When a cache fills, expired entries
+# are pruned first and the cache is cleared outright only as a last resort.
+_CACHE_MAX = 512
+_VALIDATOR_CACHE_MAX = 128
+_URL_CACHE_MAX = 256
+
+
+# Status -> exception class for error responses; anything else >= 400 maps
+# to the base AyrshareError. One dict lookup replaces a chain of
+# status_code comparisons on the error path.
+_ERR_CLASSES = {
+    401: AyrshareAuthError,
+    400: AyrshareValidationError,
+}
+
+
+# Social networks Ayrshare can address. Checked client-side before
+# single-platform calls so a typo costs an O(1) set lookup instead of a
+# full round trip and an upstream error response.
+_PLATFORMS = frozenset({
+    "facebook",
+    "instagram",
+    "linkedin",
+    "twitter",
+    "tiktok",
+    "youtube",
+    "pinterest",
+    "reddit",
+    "snapchat",
+    "telegram",
+    "gmb",
+    "bluesky",
+    "threads",
+})
+
+
+def _check_platform(platform: str) -> None:
+    """Fail fast on unknown platform names before spending a round trip"""
+    if platform.lower() not in _PLATFORMS:
+        raise AyrshareValidationError(f"Unknown platform: {platform}")
+
+
+# Path templates for parameterized endpoints: %-formatting a precompiled
+# template is cheaper than parsing an f-string spec on every call, and it
+# keeps the endpoint shapes greppable in one place.
+_POST_PATH = "/post/%s"
+_PROFILE_PATH = "/profiles/%s"
+_HISTORY_PATH = "/history/%s"
+_AUTO_REPOST_PATH = "/history/auto-repost/%s"
+_MEDIA_PATH = "/media/%s"
+_FEED_PATH = "/feed/%s"
+
+
+# Cached compiled validators: validate_python hits pydantic-core directly,
+# skipping the slower BaseModel __init__ path on every response.
+_POST_RESPONSE_ADAPTER = TypeAdapter(PostResponse)
+_ANALYTICS_RESPONSE_ADAPTER = TypeAdapter(AnalyticsResponse)
+
+
+def _compact(**kwargs: Any) -> Dict[str, Any]:
+    """
+    Build a request params/body dict, dropping None-valued keys
+
+    Replaces the `params = {}` plus per-key `if x: params[...] = x`
+    boilerplate with a single comprehension: one pass, one allocation, and
+    callers read as a flat list of fields.
+    """
+    return {key: value for key, value in kwargs.items() if value is not None}
+
+
+class _AsyncByteReader:
+    """Minimal async file adapter feeding an httpx byte stream to ijson"""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to sniff bytes vs str and discards the
+        # result, so honor the requested size; leftovers carry over.
+        if size == 0:
+            return b""
+        if not self._buffer:
+            try:
+                self._buffer = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return b""
+        if size < 0 or size >= len(self._buffer):
+            out, self._buffer = self._buffer, b""
+        else:
+            out, self._buffer = self._buffer[:size], self._buffer[size:]
+        return out
+
+
 class AyrshareClient:
     """
     Async client for Ayrshare API
 
     Handles authentication, request/response formatting, and error handling
     for all Ayrshare API endpoints.
+
+    Pooled connections are bound to the event loop that created the client,
+    so create one long-lived instance per process (e.g. in an app lifespan
+    hook) and reuse it for every call rather than constructing a client per
+    request, which discards the warm connection pool and re-pays TCP/TLS
+    handshakes. Use ``async with AyrshareClient() as client:`` or call
+    ``close()`` at shutdown so sockets are released.
     """
 
     BASE_URL = "https://app.ayrshare.com/api"
 
-    def __init__(self, api_key: Optional[str] = None, profile_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        profile_key: Optional[str] = None,
+        cache_ttl: float = 30.0,
+        max_retries: int = 3,
+        retry_posts: bool = False,
+        max_concurrency: Optional[int] = None,
+    ):
         """
         Initialize Ayrshare client
 
         Args:
             api_key: Ayrshare API key (defaults to AYRSHARE_API_KEY env var)
             profile_key: Optional profile key for multi-tenant scenarios
+            cache_ttl: Seconds to cache idempotent read responses (0 disables)
+            max_retries: Retries for transient 429/5xx errors on idempotent calls
+            retry_posts: Also retry POST requests (risks double-posting)
+            max_concurrency: Maximum requests on the wire at once; excess
+                             callers queue cooperatively instead of
+                             saturating the connection pool (defaults to
+                             AYRSHARE_MAX_CONCURRENCY env var, then 20)
         """
         self.api_key = api_key or os.getenv("AYRSHARE_API_KEY")
         if not self.api_key:
@@ -68,25 +236,213 @@ class AyrshareClient:
             )
 
         self.profile_key = profile_key or os.getenv("AYRSHARE_PROFILE_KEY")
-        self.client = httpx.AsyncClient(timeout=30.0)
-
-    def _get_headers(self) -> Dict[str, str]:
-        """Build request headers with authentication"""
-        headers = {
+        self._max_retries = max_retries
+        self._retry_posts = retry_posts
+
+        # Gate on raw request count so unbounded gather() fan-outs queue
+        # here instead of exhausting the pool and triggering 429 storms.
+        # Deployments on stricter Ayrshare rate-limit tiers can lower the
+        # cap without code changes via AYRSHARE_MAX_CONCURRENCY.
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("AYRSHARE_MAX_CONCURRENCY", "20"))
+        self.max_concurrency = max_concurrency
+        self._gate = asyncio.Semaphore(max_concurrency)
+
+        # Keys are immutable after construction, so build the auth headers
+        # once and install them as client defaults instead of rebuilding a
+        # dict (and formatting the Bearer string) on every request.
+        self._headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
-
         if self.profile_key:
-            headers["Profile-Key"] = self.profile_key
+            self._headers["Profile-Key"] = self.profile_key
+
+        # TTL cache of parsed responses for idempotent reads, keyed by
+        # (method, endpoint, body, params) and holding (ts, ttl, result)
+        # entries, bounded at _CACHE_MAX. Mutating calls invalidate the
+        # affected endpoint prefixes via invalidate_cache().
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[tuple, tuple] = {}
+
+        # In-flight futures for single-flight request coalescing: N
+        # concurrent identical reads collapse into one HTTP request.
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+        # Endpoint -> parsed httpx.URL, so repeat calls skip the f-string
+        # format, lstrip, and httpx's URL string parsing on the hot path.
+        self._url_cache: Dict[str, httpx.URL] = {}
+
+        # Last validated response per conditional read, keyed like _cache.
+        # Lets _send revalidate with If-None-Match/If-Modified-Since and
+        # serve a 304 from the stored response without re-downloading the
+        # (large) body.
+        self._validator_cache: Dict[tuple, tuple] = {}
+
+        # All requests go to a single host, so HTTP/2 multiplexes every call
+        # over one TLS connection and the raised keepalive limits let bursty
+        # workloads (bulk_post, analytics fan-outs) reuse warm connections
+        # instead of paying a handshake per request. The transport is built
+        # explicitly and lives as long as the client, keeping resolved
+        # connections warm across idle periods; transport-level connect
+        # retries stay at 0 because _send owns the retry/backoff policy.
+        self.client = httpx.AsyncClient(
+            headers=self._headers,
+            # _send passes an explicit per-request timeout (AYRSHARE_TIMEOUT
+            # based _DEFAULT_TIMEOUT, or the _TIMEOUTS override), so this
+            # only backstops direct uses of self.client.
+            timeout=_DEFAULT_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=0,
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=60.0,
+                ),
+            ),
+        )
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Request headers with authentication (cached at construction)"""
+        return self._headers
 
-        return headers
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Send a request with transient-error retries, returning the raw response
+
+        Status-code handling lives in _parse_response so this loop stays
+        focused on transport concerns. Conditional reads (_CONDITIONAL_ENDPOINTS
+        and GETs) revalidate against the last stored response: a 304 skips the
+        body transfer entirely and the stored response is returned instead.
+        """
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            if len(self._url_cache) >= _URL_CACHE_MAX:
+                self._url_cache.clear()
+            url = self._url_cache.setdefault(endpoint, httpx.URL(f"{self.BASE_URL}/{endpoint.lstrip('/')}"))
+        retryable = method in _IDEMPOTENT_METHODS or self._retry_posts
+
+        # Serialize the body with orjson (C-speed) instead of letting httpx
+        # run it through stdlib json internally.
+        content = (
+            data
+            if isinstance(data, bytes)
+            else orjson.dumps(data, option=_JSON_OPTS) if data is not None else None
+        )
+
+        validators = None
+        validator_key = None
+        if method == "GET" or endpoint in _CONDITIONAL_ENDPOINTS:
+            validator_key = (method, endpoint, content, repr(params) if params else None)
+            validators = self._validator_cache.get(validator_key)
+            if validators is not None:
+                etag, last_modified, _ = validators
+                conditional = dict(headers) if headers else {}
+                if etag:
+                    conditional["If-None-Match"] = etag
+                if last_modified:
+                    conditional["If-Modified-Since"] = last_modified
+                headers = conditional
+
+        attempt = 0
+        while True:
+            try:
+                # Hold the gate only while the request is on the wire, not
+                # across backoff sleeps, so a retrying call doesn't starve
+                # fresh ones.
+                async with self._gate:
+                    response = await self.client.request(
+                        method=method,
+                        url=url,
+                        content=content,
+                        params=params,
+                        headers=headers,
+                        timeout=_TIMEOUTS.get(endpoint, _DEFAULT_TIMEOUT),
+                    )
+            except httpx.TransportError:
+                if not retryable or attempt >= self._max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt))
+                attempt += 1
+                continue
+
+            if (
+                response.status_code in _RETRY_STATUS_CODES
+                and retryable
+                and attempt < self._max_retries
+            ):
+                await asyncio.sleep(self._retry_delay(attempt, response.headers.get("Retry-After")))
+                attempt += 1
+                continue
+
+            break
+
+        if validators is not None and response.status_code == 304:
+            # Unchanged on the server: reuse the stored full response.
+            return validators[2]
+
+        if validator_key is not None and 200 <= response.status_code < 300:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                # Each entry pins a full Response (including its body), so
+                # keep the table small; dropping it only costs one
+                # unconditional refetch per key.
+                if len(self._validator_cache) >= _VALIDATOR_CACHE_MAX:
+                    self._validator_cache.clear()
+                self._validator_cache[validator_key] = (etag, last_modified, response)
+
+        return response
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Dict[str, Any]:
+        """
+        Map error statuses to exceptions and parse the response body
+
+        Raises:
+            AyrshareAuthError: Authentication failed
+            AyrshareValidationError: Invalid request data
+            AyrshareError: General API error
+        """
+        if response.status_code >= 400:
+            exc_cls = _ERR_CLASSES.get(response.status_code, AyrshareError)
+            if exc_cls is AyrshareAuthError:
+                # Auth failures carry no useful body; skip decoding it.
+                raise exc_cls("Invalid API key or authentication failed")
+
+            # Touch the body bytes exactly once: parse for a message,
+            # falling back to a bounded slice of the raw body.
+            body = response.content
+            message = ""
+            if body:
+                try:
+                    message = orjson.loads(body).get("message")
+                except Exception:
+                    message = None
+                if message is None:
+                    message = body[:512].decode("utf-8", "replace")
+            if exc_cls is AyrshareValidationError:
+                raise exc_cls(f"Invalid request: {message}")
+            raise exc_cls(f"API error ({response.status_code}): {message}")
+
+        response.raise_for_status()
+        # orjson decodes straight from bytes, skipping the text decode
+        # that response.json() would do first.
+        return orjson.loads(response.content) if response.content else {}
 
     async def _request(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
         params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
@@ -95,7 +451,7 @@ class AyrshareClient:
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE)
             endpoint: API endpoint path
-            data: Request body data
+            data: Request body data (dict, or pre-serialized JSON bytes)
             params: Query parameters
 
         Returns:
@@ -106,43 +462,134 @@ class AyrshareClient:
             AyrshareValidationError: Invalid request data
             AyrshareError: General API error
         """
-        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+        try:
+            response = await self._send(method, endpoint, data=data, params=params)
+            return self._parse_response(response)
+        except httpx.HTTPError as e:
+            raise AyrshareError(f"HTTP request failed: {str(e)}")
+
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Backoff delay for a retry attempt, honoring Retry-After if sent"""
+        if retry_after:
+            try:
+                return float(retry_after)
+            except (TypeError, ValueError):
+                pass
+        return min(2 ** attempt * 0.25, 8.0) + random.random() * 0.1
+
+    async def _cached_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Make a request through the TTL cache for idempotent read endpoints
+
+        Stores the parsed response so hot repeats skip both the network
+        round trip and the JSON parse. Set cache_ttl=0 (or ttl=0) to bypass.
+        """
+        ttl = self._cache_ttl if ttl is None else ttl
+
+        kwargs: Dict[str, Any] = {}
+        if data is not None:
+            kwargs["data"] = data
+        if params is not None:
+            kwargs["params"] = params
+
+        if ttl <= 0:
+            return await self._request(method, endpoint, **kwargs)
+
+        key = (
+            method,
+            endpoint,
+            orjson.dumps(data, option=orjson.OPT_SORT_KEYS) if data is not None else None,
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS) if params is not None else None,
+        )
 
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < ttl:
+            return entry[2]
+
+        # Single-flight: if an identical request is already on the wire,
+        # await its result instead of firing a duplicate.
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            response = await self.client.request(
-                method=method,
-                url=url,
-                headers=self._get_headers(),
-                json=data,
-                params=params,
-            )
+            result = await self._request(method, endpoint, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved if nobody else awaited
+            raise
+        else:
+            future.set_result(result)
+            if len(self._cache) >= _CACHE_MAX:
+                # Prune entries past their own TTL first; only if the cache
+                # is still full of live entries drop it wholesale.
+                expired = [
+                    k for k, (ts, entry_ttl, _) in self._cache.items() if now - ts >= entry_ttl
+                ]
+                for k in expired:
+                    del self._cache[k]
+                if len(self._cache) >= _CACHE_MAX:
+                    self._cache.clear()
+            self._cache[key] = (now, ttl, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _get_list(
+        self,
+        method: str,
+        endpoint: str,
+        key: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = 0.0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch an endpoint and unwrap its list payload
 
-            # Handle error responses
-            if response.status_code == 401:
-                raise AyrshareAuthError("Invalid API key or authentication failed")
-            elif response.status_code == 400:
-                error_data = response.json() if response.text else {}
-                raise AyrshareValidationError(
-                    f"Invalid request: {error_data.get('message', response.text)}"
-                )
-            elif response.status_code >= 400:
-                error_data = response.json() if response.text else {}
-                raise AyrshareError(
-                    f"API error ({response.status_code}): {error_data.get('message', response.text)}"
-                )
-
-            response.raise_for_status()
-            return response.json() if response.text else {}
+        Single home for the `response.get(key) or []` tail shared by every
+        list endpoint (and a single place to hang response-shape checks
+        later). ttl=0 bypasses the cache; ttl=None uses the client default;
+        an explicit ttl reuses the TTL/single-flight machinery.
+        """
+        response = await self._cached_request(method, endpoint, data=data, params=params, ttl=ttl)
+        return response.get(key) or []
 
-        except httpx.HTTPError as e:
-            raise AyrshareError(f"HTTP request failed: {str(e)}")
+    def invalidate_cache(self, endpoint_prefix: Optional[str] = None) -> None:
+        """
+        Drop cached responses, optionally only for one endpoint prefix
+
+        Args:
+            endpoint_prefix: Endpoint prefix to invalidate (e.g. '/history');
+                             None clears the whole cache
+        """
+        if endpoint_prefix is None:
+            self._cache.clear()
+            self._validator_cache.clear()
+            return
+
+        for key in [k for k in self._cache if k[1].startswith(endpoint_prefix)]:
+            del self._cache[key]
+        for key in [k for k in self._validator_cache if k[1].startswith(endpoint_prefix)]:
+            del self._validator_cache[key]
 
     async def post(
         self,
         post_text: str,
         platforms: List[str],
         media_urls: Optional[List[str]] = None,
-        scheduled_date: Optional[str] = None,
+        scheduled_date: Optional[Union[str, datetime]] = None,
         shorten_links: bool = True,
         **kwargs,
     ) -> PostResponse:
@@ -153,7 +600,9 @@ class AyrshareClient:
             post_text: Content of the post
             platforms: List of platforms to post to (e.g., ['facebook', 'twitter', 'linkedin'])
             media_urls: Optional list of image/video URLs to attach
-            scheduled_date: Optional ISO 8601 datetime for scheduling (e.g., '2024-12-25T10:00:00Z')
+            scheduled_date: Optional datetime or ISO 8601 string for scheduling
+                            (e.g., '2024-12-25T10:00:00Z'); datetimes are
+                            serialized as RFC 3339 during encoding
             shorten_links: Whether to shorten URLs in post (default: True)
             **kwargs: Additional platform-specific parameters
 
@@ -164,8 +613,11 @@ class AyrshareClient:
             "post": post_text,
             "platforms": platforms,
             "shortenLinks": shorten_links,
-            **kwargs,
         }
+        # update() mutates in place; {**base, **kwargs} would allocate and
+        # copy a second dict on every call.
+        if kwargs:
+            data.update(kwargs)
 
         if media_urls:
             data["mediaUrls"] = media_urls
@@ -174,7 +626,9 @@ class AyrshareClient:
             data["scheduleDate"] = scheduled_date
 
         response = await self._request("POST", "/post", data=data)
-        return PostResponse(**response)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def get_post(self, post_id: str) -> Dict[str, Any]:
         """
@@ -186,7 +640,7 @@ class AyrshareClient:
         Returns:
             Post details including status and platform-specific data
         """
-        return await self._request("GET", f"/post/{post_id}")
+        return await self._cached_request("GET", _POST_PATH % post_id)
 
     async def delete_post(self, post_id: str, platforms: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -203,7 +657,10 @@ class AyrshareClient:
         if platforms:
             data["platforms"] = platforms
 
-        return await self._request("DELETE", "/post", data=data)
+        result = await self._request("DELETE", "/post", data=data)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return result
 
     async def update_post(
         self,
@@ -229,7 +686,9 @@ class AyrshareClient:
             data["platforms"] = platforms
 
         response = await self._request("PATCH", "/post", data=data)
-        return PostResponse(**response)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def get_analytics_post(
         self,
@@ -251,7 +710,7 @@ class AyrshareClient:
             data["platforms"] = platforms
 
         response = await self._request("POST", "/analytics/post", data=data)
-        return AnalyticsResponse(data=response)
+        return _ANALYTICS_RESPONSE_ADAPTER.validate_python({"data": response})
 
     async def get_analytics_social(
         self,
@@ -268,7 +727,7 @@ class AyrshareClient:
         """
         data = {"platforms": platforms}
         response = await self._request("POST", "/analytics/social", data=data)
-        return AnalyticsResponse(data=response, platforms=platforms)
+        return _ANALYTICS_RESPONSE_ADAPTER.validate_python({"data": response, "platforms": platforms})
 
     async def get_analytics_profile(
         self,
@@ -288,7 +747,7 @@ class AyrshareClient:
             data["platforms"] = platforms
 
         response = await self._request("POST", "/analytics/profile", data=data)
-        return AnalyticsResponse(data=response, platforms=platforms)
+        return _ANALYTICS_RESPONSE_ADAPTER.validate_python({"data": response, "platforms": platforms})
 
     async def get_history(
         self,
@@ -311,8 +770,51 @@ class AyrshareClient:
         else:
             data["lastDays"] = last_days
 
-        response = await self._request("POST", "/history", data=data)
-        return response.get("posts", [])
+        return await self._get_list("POST", "/history", "posts", data=data, ttl=None)
+
+    async def iter_history(
+        self,
+        last_days: Optional[int] = 30,
+        last_records: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream post history, yielding posts as they arrive
+
+        Parses the /history response incrementally instead of loading the
+        whole body, so peak memory stays flat and the first post is
+        available before the transfer finishes — useful for archival
+        exports spanning thousands of posts. Bypasses the response cache.
+
+        Args:
+            last_days: Number of days to retrieve (default: 30)
+            last_records: Alternative: number of recent records to retrieve
+
+        Yields:
+            Historical posts, one at a time
+        """
+        data = {}
+        if last_records:
+            data["lastRecords"] = last_records
+        else:
+            data["lastDays"] = last_days
+
+        url = self._url_cache.get("/history")
+        if url is None:
+            url = self._url_cache.setdefault("/history", httpx.URL(f"{self.BASE_URL}/history"))
+
+        try:
+            async with self.client.stream(
+                "POST", url, content=orjson.dumps(data), timeout=_TIMEOUTS["/history"]
+            ) as response:
+                if response.status_code >= 400:
+                    # Materialize the (small) error body so _parse_response
+                    # can raise the usual exception types.
+                    await response.aread()
+                    self._parse_response(response)
+                async for post in ijson.items(_AsyncByteReader(response), "posts.item"):
+                    yield post
+        except httpx.HTTPError as e:
+            raise AyrshareError(f"HTTP request failed: {str(e)}")
 
     async def retry_post(self, post_id: str) -> PostResponse:
         """
@@ -326,13 +828,15 @@ class AyrshareClient:
         """
         data = {"id": post_id}
         response = await self._request("PUT", "/post", data=data)
-        return PostResponse(**response)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def copy_post(
         self,
         post_id: str,
         platforms: List[str],
-        scheduled_date: Optional[str] = None,
+        scheduled_date: Optional[Union[str, datetime]] = None,
     ) -> PostResponse:
         """
         Copy an existing post to different platforms or reschedule
@@ -340,7 +844,7 @@ class AyrshareClient:
         Args:
             post_id: The post ID to copy
             platforms: Target platforms for the copy
-            scheduled_date: Optional ISO 8601 datetime for scheduling the copy
+            scheduled_date: Optional datetime or ISO 8601 string for scheduling the copy
 
         Returns:
             PostResponse with new post ID
@@ -350,7 +854,9 @@ class AyrshareClient:
             data["scheduleDate"] = scheduled_date
 
         response = await self._request("POST", "/post/copy", data=data)
-        return PostResponse(**response)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def bulk_post(
         self,
@@ -366,7 +872,86 @@ class AyrshareClient:
             Bulk operation results with individual post statuses
         """
         data = {"posts": posts}
-        return await self._request("PUT", "/post/bulk", data=data)
+        result = await self._request("PUT", "/post/bulk", data=data)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return result
+
+    @staticmethod
+    def encode_body(data: Any) -> bytes:
+        """
+        Pre-serialize a request body to JSON bytes
+
+        Serialize once and reuse the bytes when fanning the same payload out
+        to many profiles/workspaces with post_raw, instead of re-encoding
+        the dict inside every request. Accepts anything orjson serializes
+        natively — dicts, or __slots__ dataclasses for callers that keep
+        reusable payload objects.
+        """
+        return orjson.dumps(data, option=_JSON_OPTS)
+
+    async def post_raw(self, body: bytes) -> PostResponse:
+        """
+        Publish a post from a pre-serialized /post body
+
+        Args:
+            body: JSON bytes produced by encode_body
+
+        Returns:
+            PostResponse with post ID and status
+        """
+        response = await self._request("POST", "/post", data=body)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
+
+    async def _gather_bounded(self, coros, concurrency: int) -> List[Any]:
+        """
+        Await independent coroutines concurrently under a semaphore
+
+        Shared engine for the bulk/fan-out helpers: N independent calls cost
+        roughly N/concurrency round trips of wall-clock time instead of N
+        sequential ones, while the bound keeps bursts from saturating the
+        connection pool or tripping Ayrshare rate limits. Failures come back
+        as the raised exception in that slot (return_exceptions=True).
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
+    async def bulk_post_and_track(
+        self,
+        posts: List[Dict[str, Any]],
+        concurrency: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Create posts in bulk, then fetch each post's status concurrently
+
+        Args:
+            posts: List of post configurations (same shape as bulk_post)
+            concurrency: Maximum number of status fetches in flight at once
+
+        Returns:
+            Bulk operation results plus per-post status details
+        """
+        bulk_result = await self.bulk_post(posts)
+        post_ids = [p.get("id") for p in bulk_result.get("posts", []) if p.get("id")]
+
+        statuses = await self._gather_bounded(
+            (self.get_post(post_id) for post_id in post_ids), concurrency
+        )
+
+        return {
+            "bulk": bulk_result,
+            "posts": [
+                status if not isinstance(status, BaseException) else {"id": post_id, "error": str(status)}
+                for post_id, status in zip(post_ids, statuses)
+            ],
+        }
 
     async def upload_media(
         self,
@@ -383,10 +968,7 @@ class AyrshareClient:
         Returns:
             Upload result with media URL
         """
-        data = {"url": file_url}
-        if file_name:
-            data["fileName"] = file_name
-
+        data = _compact(url=file_url, fileName=file_name)
         return await self._request("POST", "/media/upload", data=data)
 
     async def validate_media_url(self, media_url: str) -> Dict[str, Any]:
@@ -417,12 +999,7 @@ class AyrshareClient:
         Returns:
             Unsplash image URL and details
         """
-        data = {}
-        if query:
-            data["query"] = query
-        if image_id:
-            data["imageId"] = image_id
-
+        data = _compact(query=query, imageId=image_id)
         return await self._request("POST", "/media/unsplash", data=data)
 
     async def post_with_auto_hashtag(
@@ -453,11 +1030,14 @@ class AyrshareClient:
                 "max": max_hashtags,
                 "position": position,
             },
-            **kwargs,
         }
+        if kwargs:
+            data.update(kwargs)
 
         response = await self._request("POST", "/post", data=data)
-        return PostResponse(**response)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def post_evergreen(
         self,
@@ -465,7 +1045,7 @@ class AyrshareClient:
         platforms: List[str],
         repeat: int,
         days_between: int,
-        start_date: Optional[str] = None,
+        start_date: Optional[Union[str, datetime]] = None,
         **kwargs,
     ) -> PostResponse:
         """
@@ -476,7 +1056,7 @@ class AyrshareClient:
             platforms: List of platforms to post to
             repeat: Number of times to repost (1-10)
             days_between: Days between reposts (minimum 2)
-            start_date: Optional start date (ISO 8601)
+            start_date: Optional start date (datetime or ISO 8601 string)
             **kwargs: Additional post parameters
 
         Returns:
@@ -489,14 +1069,17 @@ class AyrshareClient:
                 "repeat": repeat,
                 "days": days_between,
             },
-            **kwargs,
         }
+        if kwargs:
+            data.update(kwargs)
 
         if start_date:
             data["autoRepost"]["startDate"] = start_date
 
         response = await self._request("POST", "/post", data=data)
-        return PostResponse(**response)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def post_with_first_comment(
         self,
@@ -525,14 +1108,17 @@ class AyrshareClient:
             "firstComment": {
                 "comment": first_comment,
             },
-            **kwargs,
         }
+        if kwargs:
+            data.update(kwargs)
 
         if comment_media_urls:
             data["firstComment"]["mediaUrls"] = comment_media_urls
 
         response = await self._request("POST", "/post", data=data)
-        return PostResponse(**response)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def post_with_approval(
         self,
@@ -557,14 +1143,17 @@ class AyrshareClient:
             "post": post_text,
             "platforms": platforms,
             "requiresApproval": True,
-            **kwargs,
         }
+        if kwargs:
+            data.update(kwargs)
 
         if notes:
             data["notes"] = notes
 
         response = await self._request("POST", "/post", data=data)
-        return PostResponse(**response)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def approve_post(self, post_id: str) -> PostResponse:
         """
@@ -578,7 +1167,9 @@ class AyrshareClient:
         """
         data = {"id": post_id, "approved": True}
         response = await self._request("PATCH", "/post", data=data)
-        return PostResponse(**response)
+        self.invalidate_cache("/post")
+        self.invalidate_cache("/history")
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def get_profiles(self) -> List[Dict[str, Any]]:
         """
@@ -587,8 +1178,7 @@ class AyrshareClient:
         Returns:
             List of profiles with connected platforms
         """
-        response = await self._request("GET", "/profiles")
-        return response.get("profiles", [])
+        return await self._get_list("GET", "/profiles", "profiles", ttl=None)
 
     # Comments API
 
@@ -611,8 +1201,7 @@ class AyrshareClient:
         if platforms:
             data["platforms"] = platforms
 
-        response = await self._request("POST", "/comments", data=data)
-        return response.get("comments", [])
+        return await self._get_list("POST", "/comments", "comments", data=data)
 
     async def add_comment(
         self,
@@ -636,7 +1225,7 @@ class AyrshareClient:
             data["platforms"] = platforms
 
         response = await self._request("POST", "/comments/post", data=data)
-        return PostResponse(**response)
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def reply_to_comment(
         self,
@@ -657,7 +1246,7 @@ class AyrshareClient:
         """
         data = {"commentId": comment_id, "comment": reply_text, "platform": platform}
         response = await self._request("POST", "/comments/reply", data=data)
-        return PostResponse(**response)
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def delete_comment(
         self,
@@ -706,7 +1295,7 @@ class AyrshareClient:
             data["mediaUrls"] = media_urls
 
         response = await self._request("POST", "/messages/send", data=data)
-        return PostResponse(**response)
+        return _POST_RESPONSE_ADAPTER.validate_python(response)
 
     async def get_conversations(
         self,
@@ -723,12 +1312,8 @@ class AyrshareClient:
         Returns:
             List of conversation data
         """
-        data = {"platform": platform}
-        if limit:
-            data["limit"] = limit
-
-        response = await self._request("POST", "/messages/conversations", data=data)
-        return response.get("conversations", [])
+        data = _compact(platform=platform, limit=limit)
+        return await self._get_list("POST", "/messages/conversations", "conversations", data=data)
 
     async def get_conversation_messages(
         self,
@@ -747,12 +1332,8 @@ class AyrshareClient:
         Returns:
             List of messages
         """
-        data = {"conversationId": conversation_id, "platform": platform}
-        if limit:
-            data["limit"] = limit
-
-        response = await self._request("POST", "/messages/get", data=data)
-        return response.get("messages", [])
+        data = _compact(conversationId=conversation_id, platform=platform, limit=limit)
+        return await self._get_list("POST", "/messages/get", "messages", data=data)
 
     async def mark_messages_read(
         self,
@@ -791,8 +1372,7 @@ class AyrshareClient:
         if location_id:
             data["locationId"] = location_id
 
-        response = await self._request("POST", "/reviews", data=data)
-        return response.get("reviews", [])
+        return await self._get_list("POST", "/reviews", "reviews", data=data, ttl=None)
 
     async def reply_to_review(
         self,
@@ -810,7 +1390,9 @@ class AyrshareClient:
             Reply status
         """
         data = {"reviewId": review_id, "response": response_text}
-        return await self._request("POST", "/reviews/reply", data=data)
+        result = await self._request("POST", "/reviews/reply", data=data)
+        self.invalidate_cache("/reviews")
+        return result
 
     async def delete_review_response(
         self,
@@ -826,7 +1408,9 @@ class AyrshareClient:
             Deletion status
         """
         data = {"reviewId": review_id}
-        return await self._request("DELETE", "/reviews/reply", data=data)
+        result = await self._request("DELETE", "/reviews/reply", data=data)
+        self.invalidate_cache("/reviews")
+        return result
 
     # Webhooks API (Business Plan)
 
@@ -846,7 +1430,9 @@ class AyrshareClient:
             Webhook configuration with ID
         """
         data = {"url": url, "events": events}
-        return await self._request("POST", "/webhooks", data=data)
+        result = await self._request("POST", "/webhooks", data=data)
+        self.invalidate_cache("/webhooks")
+        return result
 
     async def list_webhooks(self) -> List[Dict[str, Any]]:
         """
@@ -855,8 +1441,7 @@ class AyrshareClient:
         Returns:
             List of webhook configurations
         """
-        response = await self._request("GET", "/webhooks")
-        return response.get("webhooks", [])
+        return await self._get_list("GET", "/webhooks", "webhooks", ttl=None)
 
     async def update_webhook(
         self,
@@ -881,7 +1466,9 @@ class AyrshareClient:
         if events:
             data["events"] = events
 
-        return await self._request("PATCH", "/webhooks", data=data)
+        result = await self._request("PATCH", "/webhooks", data=data)
+        self.invalidate_cache("/webhooks")
+        return result
 
     async def delete_webhook(
         self,
@@ -897,7 +1484,9 @@ class AyrshareClient:
             Deletion status
         """
         data = {"id": webhook_id}
-        return await self._request("DELETE", "/webhooks", data=data)
+        result = await self._request("DELETE", "/webhooks", data=data)
+        self.invalidate_cache("/webhooks")
+        return result
 
     # Links API (Max Pack Add-on)
 
@@ -916,10 +1505,7 @@ class AyrshareClient:
         Returns:
             Shortened URL and details
         """
-        data = {"url": url}
-        if custom_slug:
-            data["customSlug"] = custom_slug
-
+        data = _compact(url=url, customSlug=custom_slug)
         return await self._request("POST", "/links/shorten", data=data)
 
     async def get_link_analytics(
@@ -959,10 +1545,7 @@ class AyrshareClient:
         Returns:
             Ad creation response with ad ID
         """
-        data = {"postId": post_id, "budget": budget, "duration": duration}
-        if targeting:
-            data["targeting"] = targeting
-
+        data = _compact(postId=post_id, budget=budget, duration=duration, targeting=targeting)
         return await self._request("POST", "/ads/create", data=data)
 
     async def get_ad_analytics(
@@ -998,12 +1581,7 @@ class AyrshareClient:
         Returns:
             Updated ad configuration
         """
-        data = {"id": ad_id}
-        if budget:
-            data["budget"] = budget
-        if status:
-            data["status"] = status
-
+        data = _compact(id=ad_id, budget=budget, status=status)
         return await self._request("PATCH", "/ads", data=data)
 
     async def delete_ad(
@@ -1047,19 +1625,18 @@ class AyrshareClient:
         Returns:
             Profile creation response with profile key
         """
-        data = {"title": title}
-        if messaging_active is not None:
-            data["messagingActive"] = messaging_active
-        if team:
-            data["team"] = team
-        if email:
-            data["email"] = email
-        if disable_social:
-            data["disableSocial"] = disable_social
-        if tags:
-            data["tags"] = tags
+        data = _compact(
+            title=title,
+            messagingActive=messaging_active,
+            team=team,
+            email=email,
+            disableSocial=disable_social,
+            tags=tags,
+        )
 
-        return await self._request("POST", "/profiles/profile", data=data)
+        result = await self._request("POST", "/profiles/profile", data=data)
+        self.invalidate_cache("/profiles")
+        return result
 
     async def list_profiles(
         self,
@@ -1086,24 +1663,82 @@ class AyrshareClient:
         Returns:
             List of user profiles
         """
-        params = {}
-        if title:
-            params["title"] = title
-        if ref_id:
-            params["refId"] = ref_id
-        if has_active_social is not None:
-            params["hasActiveSocial"] = has_active_social
-        if includes_active_social:
-            params["includesActiveSocial"] = ",".join(includes_active_social)
-        if action_log is not None:
-            params["actionLog"] = action_log
-        if limit:
-            params["limit"] = limit
-        if cursor:
-            params["cursor"] = cursor
-
-        response = await self._request("GET", "/profiles", params=params)
-        return response.get("profiles", [])
+        params = _compact(
+            title=title,
+            refId=ref_id,
+            hasActiveSocial=has_active_social,
+            includesActiveSocial=",".join(includes_active_social) if includes_active_social else None,
+            actionLog=action_log,
+            limit=limit,
+            cursor=cursor,
+        )
+
+        return await self._get_list("GET", "/profiles", "profiles", params=params)
+
+    async def iter_profiles(
+        self,
+        *,
+        page_size: int = 100,
+        title: Optional[str] = None,
+        ref_id: Optional[str] = None,
+        has_active_social: Optional[bool] = None,
+        includes_active_social: Optional[List[str]] = None,
+        action_log: Optional[bool] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all user profiles, following pagination transparently
+
+        Follows the server's opaque nextCursor until exhausted, so memory
+        stays O(page) regardless of how many profiles the account has and
+        callers get streaming semantics (async for).
+
+        Args:
+            page_size: Profiles to fetch per request (default: 100)
+            title: Filter by profile title
+            ref_id: Filter by reference ID
+            has_active_social: Filter profiles with active social accounts
+            includes_active_social: Filter profiles with specific active platforms
+            action_log: Include action log in response
+
+        Yields:
+            User profiles, one at a time
+        """
+        # The filters never change between pages; build them once and only
+        # splice the moving cursor in per request.
+        base = _compact(
+            title=title,
+            refId=ref_id,
+            hasActiveSocial=has_active_social,
+            includesActiveSocial=",".join(includes_active_social) if includes_active_social else None,
+            actionLog=action_log,
+            limit=page_size,
+        )
+
+        cursor: Optional[str] = None
+        while True:
+            params = base if cursor is None else {**base, "cursor": cursor}
+            response = await self._request("GET", "/profiles", params=params)
+            for profile in response.get("profiles") or []:
+                yield profile
+            cursor = response.get("nextCursor")
+            if not cursor:
+                return
+
+    @staticmethod
+    def encode_cursor(cursor: str) -> str:
+        """
+        Wrap a server pagination cursor as a URL-safe token
+
+        Lets callers ship the cursor to their own clients between requests
+        (query string, form field) without worrying about its raw contents,
+        then resume with decode_cursor. The cursor stays opaque either way.
+        """
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(token: str) -> str:
+        """Recover the server pagination cursor from an encode_cursor token"""
+        return base64.urlsafe_b64decode(token.encode()).decode()
 
     async def get_profile_details(
         self,
@@ -1118,7 +1753,33 @@ class AyrshareClient:
         Returns:
             Profile details
         """
-        return await self._request("GET", f"/profiles/{profile_key}")
+        return await self._request("GET", _PROFILE_PATH % profile_key)
+
+    async def get_profile_details_bulk(
+        self,
+        profile_keys: List[str],
+        concurrency: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch several profiles' details concurrently (Business Plan required)
+
+        Args:
+            profile_keys: Profile keys to fetch
+            concurrency: Maximum number of fetches in flight at once
+
+        Returns:
+            Profile details in input order; failed lookups are returned as
+            {"profileKey": ..., "error": ...} entries
+        """
+        results = await self._gather_bounded(
+            (self.get_profile_details(profile_key) for profile_key in profile_keys), concurrency
+        )
+        return [
+            result
+            if not isinstance(result, BaseException)
+            else {"profileKey": profile_key, "error": str(result)}
+            for profile_key, result in zip(profile_keys, results)
+        ]
 
     async def update_profile(
         self,
@@ -1135,7 +1796,9 @@ class AyrshareClient:
         Returns:
             Updated profile data
         """
-        return await self._request("PATCH", f"/profiles/{profile_key}", data=settings)
+        result = await self._request("PATCH", _PROFILE_PATH % profile_key, data=settings)
+        self.invalidate_cache("/profiles")
+        return result
 
     async def delete_profile(
         self,
@@ -1150,7 +1813,9 @@ class AyrshareClient:
         Returns:
             Deletion status
         """
-        return await self._request("DELETE", f"/profiles/{profile_key}")
+        result = await self._request("DELETE", _PROFILE_PATH % profile_key)
+        self.invalidate_cache("/profiles")
+        return result
 
     # History API (Extended)
 
@@ -1167,7 +1832,31 @@ class AyrshareClient:
         Returns:
             Post details
         """
-        return await self._request("GET", f"/history/{history_id}")
+        return await self._request("GET", _HISTORY_PATH % history_id)
+
+    async def get_history_bulk(
+        self,
+        history_ids: List[str],
+        concurrency: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch several history entries concurrently
+
+        Args:
+            history_ids: History IDs to fetch
+            concurrency: Maximum number of fetches in flight at once
+
+        Returns:
+            Post details in input order; failed lookups are returned as
+            {"id": ..., "error": ...} entries
+        """
+        results = await self._gather_bounded(
+            (self.get_history_by_id(history_id) for history_id in history_ids), concurrency
+        )
+        return [
+            result if not isinstance(result, BaseException) else {"id": history_id, "error": str(result)}
+            for history_id, result in zip(history_ids, results)
+        ]
 
     async def get_scheduled_posts(self) -> List[Dict[str, Any]]:
         """
@@ -1176,8 +1865,7 @@ class AyrshareClient:
         Returns:
             List of scheduled posts
         """
-        response = await self._request("GET", "/history/scheduled")
-        return response.get("posts", [])
+        return await self._get_list("GET", "/history/scheduled", "posts")
 
     async def get_auto_repost_series(
         self,
@@ -1192,8 +1880,7 @@ class AyrshareClient:
         Returns:
             List of posts in the series
         """
-        response = await self._request("GET", f"/history/auto-repost/{auto_repost_id}")
-        return response.get("posts", [])
+        return await self._get_list("GET", _AUTO_REPOST_PATH % auto_repost_id, "posts")
 
     # Media API (Extended)
 
@@ -1212,14 +1899,33 @@ class AyrshareClient:
         Returns:
             List of media items
         """
-        params = {}
-        if limit:
-            params["limit"] = limit
-        if cursor:
-            params["cursor"] = cursor
+        params = _compact(limit=limit, cursor=cursor)
+
+        return await self._get_list("GET", "/media", "media", params=params)
+
+    async def iter_media(self, *, page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all uploaded media, following pagination transparently
+
+        Follows the server's opaque nextCursor until exhausted, keeping
+        memory O(page) for large media libraries.
+
+        Args:
+            page_size: Media items to fetch per request (default: 100)
 
-        response = await self._request("GET", "/media", params=params)
-        return response.get("media", [])
+        Yields:
+            Media items, one at a time
+        """
+        base = {"limit": page_size}
+        cursor: Optional[str] = None
+        while True:
+            params = base if cursor is None else {**base, "cursor": cursor}
+            response = await self._request("GET", "/media", params=params)
+            for item in response.get("media") or []:
+                yield item
+            cursor = response.get("nextCursor")
+            if not cursor:
+                return
 
     async def get_media_details(
         self,
@@ -1234,7 +1940,31 @@ class AyrshareClient:
         Returns:
             Media details
         """
-        return await self._request("GET", f"/media/{media_id}")
+        return await self._request("GET", _MEDIA_PATH % media_id)
+
+    async def get_media_bulk(
+        self,
+        media_ids: List[str],
+        concurrency: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch several media items concurrently
+
+        Args:
+            media_ids: Media IDs to fetch
+            concurrency: Maximum number of fetches in flight at once
+
+        Returns:
+            Media details in input order; failed lookups are returned as
+            {"id": ..., "error": ...} entries
+        """
+        results = await self._gather_bounded(
+            (self.get_media_details(media_id) for media_id in media_ids), concurrency
+        )
+        return [
+            result if not isinstance(result, BaseException) else {"id": media_id, "error": str(result)}
+            for media_id, result in zip(media_ids, results)
+        ]
 
     async def delete_media(
         self,
@@ -1249,7 +1979,7 @@ class AyrshareClient:
         Returns:
             Deletion status
         """
-        return await self._request("DELETE", f"/media/{media_id}")
+        return await self._request("DELETE", _MEDIA_PATH % media_id)
 
     # Auto Schedule API
 
@@ -1266,7 +1996,9 @@ class AyrshareClient:
         Returns:
             Schedule creation response
         """
-        return await self._request("POST", "/auto-schedule/set", data=schedule_config)
+        result = await self._request("POST", "/auto-schedule/set", data=schedule_config)
+        self.invalidate_cache("/auto-schedule")
+        return result
 
     async def get_auto_schedule(self) -> Dict[str, Any]:
         """
@@ -1275,7 +2007,7 @@ class AyrshareClient:
         Returns:
             Auto-schedule settings
         """
-        return await self._request("GET", "/auto-schedule")
+        return await self._cached_request("GET", "/auto-schedule", ttl=60.0)
 
     async def update_auto_schedule(
         self,
@@ -1290,7 +2022,9 @@ class AyrshareClient:
         Returns:
             Updated schedule
         """
-        return await self._request("PUT", "/auto-schedule/update", data=schedule_config)
+        result = await self._request("PUT", "/auto-schedule/update", data=schedule_config)
+        self.invalidate_cache("/auto-schedule")
+        return result
 
     async def delete_auto_schedule(self) -> Dict[str, Any]:
         """
@@ -1299,7 +2033,9 @@ class AyrshareClient:
         Returns:
             Deletion status
         """
-        return await self._request("DELETE", "/auto-schedule")
+        result = await self._request("DELETE", "/auto-schedule")
+        self.invalidate_cache("/auto-schedule")
+        return result
 
     # Brand API
 
@@ -1316,7 +2052,9 @@ class AyrshareClient:
         Returns:
             Brand profile creation response
         """
-        return await self._request("POST", "/brand/create", data=brand_data)
+        result = await self._request("POST", "/brand/create", data=brand_data)
+        self.invalidate_cache("/brand")
+        return result
 
     async def get_brand_assets(self) -> Dict[str, Any]:
         """
@@ -1325,7 +2063,7 @@ class AyrshareClient:
         Returns:
             Brand assets
         """
-        return await self._request("GET", "/brand")
+        return await self._cached_request("GET", "/brand", ttl=300.0)
 
     async def update_brand_settings(
         self,
@@ -1340,7 +2078,9 @@ class AyrshareClient:
         Returns:
             Updated brand profile
         """
-        return await self._request("PUT", "/brand/update", data=brand_data)
+        result = await self._request("PUT", "/brand/update", data=brand_data)
+        self.invalidate_cache("/brand")
+        return result
 
     # Feed API
 
@@ -1359,12 +2099,39 @@ class AyrshareClient:
         Returns:
             List of feed posts
         """
-        params = {}
-        if limit:
-            params["limit"] = limit
+        _check_platform(platform)
+        params = _compact(limit=limit)
 
-        response = await self._request("GET", f"/feed/{platform}", params=params)
-        return response.get("posts", [])
+        # Dashboards poll the same (platform, limit) repeatedly; a short TTL
+        # plus single-flight coalescing absorbs those repeats and prevents a
+        # thundering herd on cache misses.
+        return await self._get_list("GET", _FEED_PATH % platform, "posts", params=params, ttl=30.0)
+
+    async def get_all_platform_feeds(
+        self,
+        platforms: List[str],
+        limit: Optional[int] = None,
+        concurrency: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Fetch feeds for several platforms concurrently
+
+        Args:
+            platforms: Platforms to fetch feeds for
+            limit: Optional limit on posts per platform
+            concurrency: Maximum number of fetches in flight at once
+
+        Returns:
+            Mapping of platform to its feed posts; failed platforms map to
+            {"error": ...}
+        """
+        results = await self._gather_bounded(
+            (self.get_social_feed(platform, limit=limit) for platform in platforms), concurrency
+        )
+        return {
+            platform: result if not isinstance(result, BaseException) else {"error": str(result)}
+            for platform, result in zip(platforms, results)
+        }
 
     async def get_all_feeds(
         self,
@@ -1379,9 +2146,7 @@ class AyrshareClient:
         Returns:
             Feeds from all platforms
         """
-        params = {}
-        if limit:
-            params["limit"] = limit
+        params = _compact(limit=limit)
 
         response = await self._request("GET", "/feed", params=params)
         return response
@@ -1405,12 +2170,9 @@ class AyrshareClient:
         Returns:
             Generated post text
         """
-        data = {"prompt": prompt}
-        if platform:
-            data["platform"] = platform
-        if tone:
-            data["tone"] = tone
-
+        if platform is not None:
+            _check_platform(platform)
+        data = _compact(prompt=prompt, platform=platform, tone=tone)
         return await self._request("POST", "/generate/text", data=data)
 
     async def generate_hashtags(
@@ -1428,10 +2190,7 @@ class AyrshareClient:
         Returns:
             Generated hashtags
         """
-        data = {"content": content}
-        if count:
-            data["count"] = count
-
+        data = _compact(content=content, count=count)
         return await self._request("POST", "/generate/hashtags", data=data)
 
     async def generate_caption(
@@ -1449,10 +2208,7 @@ class AyrshareClient:
         Returns:
             Generated caption
         """
-        data = {"imageUrl": image_url}
-        if style:
-            data["style"] = style
-
+        data = _compact(imageUrl=image_url, style=style)
         return await self._request("POST", "/generate/caption", data=data)
 
     # Hashtags API
@@ -1472,12 +2228,8 @@ class AyrshareClient:
         Returns:
             List of suggested hashtags
         """
-        data = {"content": content}
-        if platform:
-            data["platform"] = platform
-
-        response = await self._request("POST", "/hashtags/suggest", data=data)
-        return response.get("hashtags", [])
+        data = _compact(content=content, platform=platform)
+        return await self._get_list("POST", "/hashtags/suggest", "hashtags", data=data)
 
     async def get_trending_hashtags(
         self,
@@ -1494,12 +2246,11 @@ class AyrshareClient:
         Returns:
             List of trending hashtags
         """
-        params = {"platform": platform}
-        if region:
-            params["region"] = region
-
-        response = await self._request("GET", "/hashtags/trending", params=params)
-        return response.get("hashtags", [])
+        _check_platform(platform)
+        params = _compact(platform=platform, region=region)
+        # Trending lists move slowly relative to agent polling; 15s of reuse
+        # per (platform, region) cuts most of the repeat traffic.
+        return await self._get_list("GET", "/hashtags/trending", "hashtags", params=params, ttl=15.0)
 
     async def analyze_hashtag_performance(
         self,
@@ -1516,10 +2267,7 @@ class AyrshareClient:
         Returns:
             Hashtag performance data
         """
-        data = {"hashtag": hashtag}
-        if time_range:
-            data["timeRange"] = time_range
-
+        data = _compact(hashtag=hashtag, timeRange=time_range)
         return await self._request("POST", "/hashtags/analyze", data=data)
 
     # User API
@@ -1531,7 +2279,7 @@ class AyrshareClient:
         Returns:
             User account details
         """
-        return await self._request("GET", "/user")
+        return await self._cached_request("GET", "/user", ttl=60.0)
 
     async def update_user_settings(
         self,
@@ -1546,7 +2294,9 @@ class AyrshareClient:
         Returns:
             Updated user settings
         """
-        return await self._request("PUT", "/user/update", data=settings)
+        result = await self._request("PUT", "/user/update", data=settings)
+        self.invalidate_cache("/user")
+        return result
 
     async def get_api_limits(self) -> Dict[str, Any]:
         """
@@ -1555,7 +2305,7 @@ class AyrshareClient:
         Returns:
             API limits and usage data
         """
-        return await self._request("GET", "/user/limits")
+        return await self._cached_request("GET", "/user/limits", ttl=30.0)
 
     # Utils API
 
@@ -1582,8 +2332,8 @@ class AyrshareClient:
         Returns:
             List of timezone identifiers
         """
-        response = await self._request("GET", "/utils/timezones")
-        return response.get("timezones", [])
+        # Timezone identifiers are effectively static; cache for a day.
+        return await self._get_list("GET", "/utils/timezones", "timezones", ttl=86400.0)
 
     async def convert_timezone(
         self,
@@ -1637,9 +2387,62 @@ class AyrshareClient:
         Returns:
             Validation result
         """
+        _check_platform(platform)
         data = {"url": media_url, "platform": platform}
         return await self._request("POST", "/validate/media", data=data)
 
+    async def validate_media_multi(
+        self,
+        media_url: str,
+        platforms: List[str],
+        concurrency: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Validate media against several platforms concurrently
+
+        Args:
+            media_url: Media URL
+            platforms: Target platforms
+            concurrency: Maximum number of validations in flight at once
+
+        Returns:
+            Mapping of platform to its validation result; failed checks map
+            to {"error": ...}
+        """
+        results = await self._gather_bounded(
+            (self.validate_media(media_url, platform) for platform in platforms), concurrency
+        )
+        return {
+            platform: result if not isinstance(result, BaseException) else {"error": str(result)}
+            for platform, result in zip(platforms, results)
+        }
+
+    async def validate_media_batch(
+        self,
+        media_url: str,
+        platforms: List[str],
+    ) -> Dict[str, Any]:
+        """
+        Validate media against several platforms in a single request
+
+        Sends the platform list in one POST (1 round trip instead of N);
+        if the API rejects the array form, falls back to concurrent
+        per-platform checks via validate_media_multi.
+
+        Args:
+            media_url: Media URL
+            platforms: Target platforms
+
+        Returns:
+            Combined validation result (single-request form), or a mapping
+            of platform to result from the fallback
+        """
+        data = {"url": media_url, "platforms": platforms}
+        try:
+            return await self._request("POST", "/validate/media", data=data)
+        except AyrshareValidationError:
+            return await self.validate_media_multi(media_url, platforms)
+
     async def validate_schedule_time(
         self,
         schedule_date: str,
@@ -1655,9 +2458,41 @@ class AyrshareClient:
         Returns:
             Validation result
         """
+        _check_platform(platform)
         data = {"scheduleDate": schedule_date, "platform": platform}
         return await self._request("POST", "/validate/schedule", data=data)
 
+    async def validate_schedule_time_batch(
+        self,
+        schedule_date: str,
+        platforms: List[str],
+    ) -> Dict[str, Any]:
+        """
+        Validate a schedule time against several platforms in one request
+
+        Sends the platform list in one POST; if the API rejects the array
+        form, falls back to concurrent per-platform checks.
+
+        Args:
+            schedule_date: Schedule date (ISO 8601)
+            platforms: Target platforms
+
+        Returns:
+            Combined validation result (single-request form), or a mapping
+            of platform to result from the fallback
+        """
+        data = {"scheduleDate": schedule_date, "platforms": platforms}
+        try:
+            return await self._request("POST", "/validate/schedule", data=data)
+        except AyrshareValidationError:
+            results = await self._gather_bounded(
+                (self.validate_schedule_time(schedule_date, platform) for platform in platforms), 10
+            )
+            return {
+                platform: result if not isinstance(result, BaseException) else {"error": str(result)}
+                for platform, result in zip(platforms, results)
+            }
+
     async def close(self):
         """Close the HTTP client"""
         await self.client.aclose()
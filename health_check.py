@@ -12,6 +12,11 @@ async def health_check() -> Dict[str, Any]:
     """
     Check server health status
 
+    Safe to call from the event loop: the potentially slow system probes
+    (platform.platform() can shell out) are captured once at import time in
+    production_config, so get_health_status only assembles precomputed
+    fields plus the current counters.
+
     Returns comprehensive health information including:
     - Server status and version
     - System information
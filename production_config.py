@@ -5,12 +5,17 @@ This module provides production-ready logging, error handling, and monitoring
 configurations for the Ayrshare MCP server.
 """
 
+import atexit
+import copy
 import os
+import queue
 import sys
 import logging
-import json
-from datetime import datetime
+import platform as _platform
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any, Optional
+
+import orjson
 from functools import wraps
 import time
 
@@ -36,12 +41,26 @@ class ProductionConfig:
     AYRSHARE_DEBUG = os.getenv("AYRSHARE_DEBUG", "false").lower() == "true"
 
 
+def _iso_utc(ts: float) -> str:
+    """
+    ISO 8601 UTC timestamp (microsecond precision, Z suffix) from epoch time
+
+    time.gmtime + strftime is several times cheaper than constructing a
+    datetime per call, which matters in JsonFormatter where this runs for
+    every log record.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts)) + f".{int(ts % 1 * 1e6):06d}Z"
+
+
 class JsonFormatter(logging.Formatter):
     """JSON log formatter for structured logging"""
 
-    def format(self, record):
+    def record_data(self, record) -> Dict[str, Any]:
+        """Build the structured payload for a record (shared with the bytes handler)"""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # logging already captured the record's creation time; reuse it
+            # instead of taking a second clock reading.
+            "timestamp": _iso_utc(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -59,38 +78,117 @@ class JsonFormatter(logging.Formatter):
             log_data["exception"] = self.formatException(record.exc_info)
             log_data["stack_trace"] = self.formatStack(record.stack_info) if record.stack_info else None
 
-        return json.dumps(log_data)
+        return log_data
+
+    def format(self, record):
+        # orjson serializes in C and this runs per record; default=str keeps
+        # arbitrary extra_fields values loggable instead of raising.
+        return orjson.dumps(self.record_data(record), default=str).decode()
+
+
+class JsonBytesHandler(logging.StreamHandler):
+    """
+    Stream handler that writes orjson's bytes straight to the stream buffer
+
+    orjson.dumps already returns UTF-8 bytes; writing them to the stream's
+    binary buffer skips the decode-then-re-encode round trip a plain
+    StreamHandler imposes on every record. Runs on the QueueListener thread,
+    never the event loop. Falls back to the text path when the stream has no
+    binary buffer (e.g. under test capture).
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(stream if stream is not None else sys.stdout)
+        self.setFormatter(JsonFormatter())
+
+    def emit(self, record):
+        buffer = getattr(self.stream, "buffer", None)
+        if buffer is None:
+            super().emit(record)
+            return
+        try:
+            payload = orjson.dumps(self.formatter.record_data(record), default=str)
+            buffer.write(payload + b"\n")
+            buffer.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class _RawQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted
+
+    The stock prepare() pre-formats each record and nulls exc_info /
+    exc_text / stack_info before it crosses the queue, which flattens
+    tracebacks into "message" and leaves JsonFormatter's "exception" and
+    "stack_trace" fields permanently empty. Copy the record instead,
+    resolving %-args up front (so mutable values can't change before the
+    listener thread formats it) but keeping the exception state intact for
+    JsonFormatter to render on the other side.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Active QueueListener, stopped on re-setup and at interpreter exit so
+# queued records are flushed before stdout closes.
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener():
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
 
 
 def setup_logging(name: str = "ayrshare-mcp") -> logging.Logger:
     """
     Configure production logging
 
+    Formatting and stdout writes happen on a QueueListener thread: the
+    event loop only enqueues the LogRecord (O(1)), so a slow stdout pipe
+    to the MCP host can't stall async handlers mid-request.
+
     Args:
         name: Logger name
 
     Returns:
         Configured logger instance
     """
+    global _log_listener
+
     logger = logging.getLogger(name)
     logger.setLevel(ProductionConfig.LOG_LEVEL)
 
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers (and listener) to avoid duplicates
     logger.handlers.clear()
-
-    handler = logging.StreamHandler(sys.stdout)
+    _stop_log_listener()
 
     if ProductionConfig.LOG_FORMAT == "json":
-        handler.setFormatter(JsonFormatter())
+        stream_handler = JsonBytesHandler()
     else:
-        handler.setFormatter(
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(
             logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
         )
 
-    logger.addHandler(handler)
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(_RawQueueHandler(log_queue))
+
+    _log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+
     logger.propagate = False
 
     return logger
@@ -101,11 +199,22 @@ logger = setup_logging()
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter"""
+    """
+    Token-bucket rate limiter
+
+    Holds two float buckets refilled proportionally to elapsed time instead
+    of one timestamp per request: constant memory, zero allocation, and a
+    handful of arithmetic ops per check — this runs on every tool call via
+    with_error_handling. Uses time.monotonic() so the buckets are immune to
+    wall-clock jumps.
+    """
 
     def __init__(self):
-        self.minute_calls = []
-        self.hour_calls = []
+        self.minute_limit = ProductionConfig.RATE_LIMIT_PER_MINUTE
+        self.hour_limit = ProductionConfig.RATE_LIMIT_PER_HOUR
+        self.minute_tokens = float(self.minute_limit)
+        self.hour_tokens = float(self.hour_limit)
+        self.last_refill = time.monotonic()
 
     def check_limit(self) -> tuple[bool, Optional[str]]:
         """
@@ -114,30 +223,41 @@ class RateLimiter:
         Returns:
             Tuple of (allowed, error_message)
         """
-        now = time.time()
-
-        # Clean old entries
-        minute_ago = now - 60
-        hour_ago = now - 3600
-
-        self.minute_calls = [t for t in self.minute_calls if t > minute_ago]
-        self.hour_calls = [t for t in self.hour_calls if t > hour_ago]
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.last_refill = now
+
+        # Refill both buckets before checking either, so a minute-level
+        # rejection doesn't starve the hourly bucket of its refill.
+        if self.minute_limit > 0:
+            self.minute_tokens = min(
+                float(self.minute_limit), self.minute_tokens + elapsed * self.minute_limit / 60.0
+            )
+        if self.hour_limit > 0:
+            self.hour_tokens = min(
+                float(self.hour_limit), self.hour_tokens + elapsed * self.hour_limit / 3600.0
+            )
 
-        # Check limits
-        if ProductionConfig.RATE_LIMIT_PER_MINUTE > 0:
-            if len(self.minute_calls) >= ProductionConfig.RATE_LIMIT_PER_MINUTE:
-                return False, f"Rate limit exceeded: {ProductionConfig.RATE_LIMIT_PER_MINUTE} requests per minute"
+        if self.minute_limit > 0 and self.minute_tokens < 1.0:
+            return False, f"Rate limit exceeded: {self.minute_limit} requests per minute"
 
-        if ProductionConfig.RATE_LIMIT_PER_HOUR > 0:
-            if len(self.hour_calls) >= ProductionConfig.RATE_LIMIT_PER_HOUR:
-                return False, f"Rate limit exceeded: {ProductionConfig.RATE_LIMIT_PER_HOUR} requests per hour"
+        if self.hour_limit > 0 and self.hour_tokens < 1.0:
+            return False, f"Rate limit exceeded: {self.hour_limit} requests per hour"
 
-        # Record this call
-        self.minute_calls.append(now)
-        self.hour_calls.append(now)
+        # Consume one token per accepted call
+        if self.minute_limit > 0:
+            self.minute_tokens -= 1.0
+        if self.hour_limit > 0:
+            self.hour_tokens -= 1.0
 
         return True, None
 
+    def current_usage(self) -> tuple[int, int]:
+        """Approximate requests consumed in the current minute/hour windows"""
+        minute_used = int(self.minute_limit - self.minute_tokens) if self.minute_limit > 0 else 0
+        hour_used = int(self.hour_limit - self.hour_tokens) if self.hour_limit > 0 else 0
+        return minute_used, hour_used
+
 
 # Global rate limiter instance
 rate_limiter = RateLimiter()
@@ -149,17 +269,21 @@ def with_error_handling(func):
     """
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
+        # perf_counter is monotonic and cheaper than time.time for durations
+        start_time = time.perf_counter()
         tool_name = func.__name__
 
         try:
-            logger.debug(f"Calling tool: {tool_name}", extra={
-                "extra_fields": {
-                    "tool": tool_name,
-                    "args_count": len(args),
-                    "kwargs_keys": list(kwargs.keys())
-                }
-            })
+            # Gate on isEnabledFor so the extras dict isn't built for
+            # records the level filters out anyway.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Calling tool: {tool_name}", extra={
+                    "extra_fields": {
+                        "tool": tool_name,
+                        "args_count": len(args),
+                        "kwargs_keys": list(kwargs.keys())
+                    }
+                })
 
             # Check rate limits
             allowed, error_msg = rate_limiter.check_limit()
@@ -176,23 +300,26 @@ def with_error_handling(func):
             # Execute the tool
             result = await func(*args, **kwargs)
 
-            duration = time.time() - start_time
-            logger.info(f"Tool completed: {tool_name}", extra={
-                "extra_fields": {
-                    "tool": tool_name,
-                    "duration_seconds": round(duration, 3),
-                    "success": True
-                }
-            })
+            if logger.isEnabledFor(logging.INFO):
+                duration = time.perf_counter() - start_time
+                logger.info(f"Tool completed: {tool_name}", extra={
+                    "extra_fields": {
+                        "tool": tool_name,
+                        # integer ms: avoids float-repr work during
+                        # serialization and is plenty of resolution here
+                        "duration_ms": int(duration * 1000),
+                        "success": True
+                    }
+                })
 
             return result
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             logger.error(f"Tool error: {tool_name}", exc_info=True, extra={
                 "extra_fields": {
                     "tool": tool_name,
-                    "duration_seconds": round(duration, 3),
+                    "duration_ms": int(duration * 1000),
                     "error_type": type(e).__name__,
                     "error_message": str(e)
                 }
@@ -208,6 +335,29 @@ def with_error_handling(func):
     return wrapper
 
 
+# Everything here is fixed for the life of the process — platform.platform()
+# in particular can shell out on some systems, so probe it once at import
+# instead of on every health poll. Per-call handlers only add the timestamp
+# and rate-limit counters.
+_HEALTH_STATIC = {
+    "status": "healthy",
+    "server": {
+        "name": "Ayrshare MCP Server",
+        "version": "1.0.0",
+        "transport": ProductionConfig.TRANSPORT,
+        "log_level": ProductionConfig.LOG_LEVEL
+    },
+    "system": {
+        "python_version": _platform.python_version(),
+        "platform": _platform.platform()
+    },
+    "configuration": {
+        "ayrshare_timeout": ProductionConfig.AYRSHARE_TIMEOUT,
+        "debug_mode": ProductionConfig.AYRSHARE_DEBUG
+    }
+}
+
+
 def get_health_status() -> Dict[str, Any]:
     """
     Get server health status
@@ -215,32 +365,17 @@ def get_health_status() -> Dict[str, Any]:
     Returns:
         Dictionary with health check information
     """
-    import platform
-
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "server": {
-            "name": "Ayrshare MCP Server",
-            "version": "1.0.0",
-            "transport": ProductionConfig.TRANSPORT,
-            "log_level": ProductionConfig.LOG_LEVEL
-        },
-        "system": {
-            "python_version": platform.python_version(),
-            "platform": platform.platform()
-        },
-        "rate_limits": {
-            "per_minute": ProductionConfig.RATE_LIMIT_PER_MINUTE,
-            "per_hour": ProductionConfig.RATE_LIMIT_PER_HOUR,
-            "current_minute": len(rate_limiter.minute_calls),
-            "current_hour": len(rate_limiter.hour_calls)
-        },
-        "configuration": {
-            "ayrshare_timeout": ProductionConfig.AYRSHARE_TIMEOUT,
-            "debug_mode": ProductionConfig.AYRSHARE_DEBUG
-        }
+    current_minute, current_hour = rate_limiter.current_usage()
+
+    health = dict(_HEALTH_STATIC)
+    health["timestamp"] = _iso_utc(time.time())
+    health["rate_limits"] = {
+        "per_minute": ProductionConfig.RATE_LIMIT_PER_MINUTE,
+        "per_hour": ProductionConfig.RATE_LIMIT_PER_HOUR,
+        "current_minute": current_minute,
+        "current_hour": current_hour
     }
+    return health
 
 
 def log_startup():
@@ -6,34 +6,80 @@ Supports posting to 13+ platforms including Facebook, Instagram, Twitter/X, Link
 TikTok, YouTube, Pinterest, Reddit, Snapchat, Telegram, Threads, Bluesky, and Google Business Profile.
 """
 
+import asyncio
 import os
-from typing import List, Optional, Dict, Any
+import re
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import wraps
+from zoneinfo import ZoneInfo, available_timezones
+from typing import List, Optional, Dict, Any
 
-from dotenv import load_dotenv
+import httpx
 from fastmcp import FastMCP
+from typing_extensions import TypedDict
 
 from ayrshare_client import AyrshareClient, AyrshareError
 
-# Load environment variables
-load_dotenv()
+# Load environment variables — skipped entirely (import and filesystem scan)
+# when the process is already configured, which trims cold-start time.
+if not os.getenv("AYRSHARE_API_KEY"):
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@asynccontextmanager
+async def _lifespan(server: "FastMCP"):
+    """Close the shared clients (and their connection pools) at server shutdown"""
+    global _client, _probe_client
+    try:
+        yield
+    finally:
+        if _client is not None:
+            await _client.close()
+            _client = None
+        if _probe_client is not None:
+            await _probe_client.aclose()
+            _probe_client = None
+
 
 # Initialize FastMCP server
-mcp = FastMCP("Ayrshare Social Media API")
+mcp = FastMCP("Ayrshare Social Media API", lifespan=_lifespan)
 
 # Client will be initialized lazily
 _client: Optional[AyrshareClient] = None
 
+# Separate unauthenticated client for media HEAD probes: media URLs point at
+# arbitrary third-party hosts, which must never see the Authorization and
+# Profile-Key headers the Ayrshare client's pool attaches by default.
+_probe_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_probe_client() -> httpx.AsyncClient:
+    global _probe_client
+    if _probe_client is None:
+        _probe_client = httpx.AsyncClient()
+    return _probe_client
+
 
 def get_client() -> AyrshareClient:
-    """Get or create the Ayrshare client instance"""
+    """
+    Get or create the Ayrshare client instance
+
+    One client is shared by every tool so all calls reuse its persistent
+    httpx connection pool (keep-alive + HTTP/2) instead of re-paying the
+    TCP/TLS handshake per invocation.
+    """
     global _client
     if _client is None:
         _client = AyrshareClient()
     return _client
 
 
-# Supported platforms
+# Supported platforms (the list shape is what error payloads return)
 SUPPORTED_PLATFORMS = [
     "facebook",
     "instagram",
@@ -50,14 +96,186 @@ SUPPORTED_PLATFORMS = [
     "gmb",  # Google My Business / Google Business Profile
 ]
 
+# Frozenset for O(1) membership tests on every validation; includes the
+# "x" alias so the check needs no special case.
+SUPPORTED_PLATFORMS_SET = frozenset(SUPPORTED_PLATFORMS) | {"x"}
+
+
+def ayrshare_tool(fn):
+    """
+    Translate AyrshareError raised by a tool into the shared error payload
+
+    One wrapper replaces the identical try/except block every tool used to
+    carry, keeping the error shape in a single place and each tool body
+    smaller. Applied under @mcp.tool(), which reads the wrapped signature.
+    """
+
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except AyrshareError as e:
+            return {"status": "error", "message": str(e)}
+
+    return wrapper
+
+
+class PostResult(TypedDict, total=False):
+    """
+    Envelope returned by the post-mutating tools
+
+    A TypedDict rather than a dataclass: tools still build and return plain
+    dicts (nothing to convert at the MCP boundary), but the shared shape is
+    typed once and FastMCP derives a precise output schema from it.
+    """
+
+    status: str
+    post_id: Optional[str]
+    post_status: Optional[str]
+    ref_id: Optional[str]
+    errors: Any
+    warnings: Any
+    updated: bool
+    retried: bool
+    approved: bool
+    # Error-path fields
+    message: str
+    supported_platforms: List[str]
+
+
+class CommentResult(TypedDict, total=False):
+    """Envelope returned by the comment tools (same TypedDict approach as PostResult)"""
+
+    status: str
+    post_id: str
+    comment_id: str
+    reply_id: Optional[str]
+    platform: str
+    platforms: Any  # list of platforms, or "all"
+    total_comments: int
+    comments: List[Dict[str, Any]]
+    deleted_from: Any
+    warnings: Any
+    result: Dict[str, Any]
+    # Error-path field
+    message: str
+
+
+# In-flight analytics fan-in: concurrent identical reads await one upstream
+# request instead of each paying a round trip and an API quota unit. Entries
+# exist only while a request is on the wire — nothing is cached afterwards,
+# so results are always as fresh as a direct call.
+_analytics_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+async def _single_flight(key: tuple, supplier) -> Any:
+    """Await an identical in-flight request if one exists, else run supplier"""
+    inflight = _analytics_inflight.get(key)
+    if inflight is not None:
+        return await inflight
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _analytics_inflight[key] = future
+    try:
+        result = await supplier()
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved if nobody else awaited
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _analytics_inflight.pop(key, None)
+
+
+# Fast-path check for scheduled dates: one precompiled match covers the
+# dominant YYYY-MM-DDTHH:MM:SS[.ffffff][Z|±HH:MM] form (with field ranges)
+# without allocating or running the general datetime parser.
+_ISO_DATE_RE = re.compile(
+    r"^\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])"
+    r"T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d+)?"
+    r"(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?$"
+)
+
+_DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _validate_scheduled_date(scheduled_date: str) -> Optional[Dict[str, Any]]:
+    """
+    Fail fast on malformed schedule timestamps
+
+    Returns the error payload for the caller, or None when the value parses.
+    The regex plus a month-length check accepts exactly what the old
+    datetime parse accepted for the common shape; datetime.fromisoformat
+    stays as the fallback so exotic-but-valid ISO 8601 forms still pass.
+    """
+    if _ISO_DATE_RE.match(scheduled_date):
+        month = int(scheduled_date[5:7])
+        day = int(scheduled_date[8:10])
+        if day <= _DAYS_IN_MONTH[month - 1]:
+            if month != 2 or day < 29:
+                return None
+            year = int(scheduled_date[:4])
+            if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+                return None
+
+    # Rare path: the general parser (and its import) is only needed for
+    # shapes the regex doesn't cover.
+    from datetime import datetime
+
+    try:
+        datetime.fromisoformat(scheduled_date.replace("Z", "+00:00"))
+    except ValueError:
+        return {
+            "status": "error",
+            "message": "Invalid date format. Use ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ",
+        }
+    return None
+
+
+def _normalize_platforms(platforms: List[str]) -> List[str]:
+    """
+    Canonicalize platform names once at tool entry
+
+    Lowercases each name a single time and maps the "x" alias to "twitter",
+    so validation and the client both see one canonical spelling instead of
+    re-lowering (and special-casing the alias) at every use.
+    """
+    normalized = []
+    for platform in platforms:
+        platform = platform.lower()
+        normalized.append("twitter" if platform == "x" else platform)
+    return normalized
+
+
+def _validate_platforms(platforms: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Fail fast on unsupported platform names
+
+    Expects input already passed through _normalize_platforms. Returns the
+    error payload to hand back to the caller, or None when every platform is
+    valid. Catching a typo here costs microseconds; letting Ayrshare reject
+    it costs a full round trip.
+    """
+    invalid_platforms = [p for p in platforms if p not in SUPPORTED_PLATFORMS_SET]
+    if invalid_platforms:
+        return {
+            "status": "error",
+            "message": f"Invalid platforms: {', '.join(invalid_platforms)}",
+            "supported_platforms": SUPPORTED_PLATFORMS,
+        }
+    return None
+
 
 @mcp.tool()
+@ayrshare_tool
 async def post_to_social(
     post_text: str,
     platforms: List[str],
     media_urls: Optional[List[str]] = None,
     shorten_links: bool = True,
-) -> Dict[str, Any]:
+) -> PostResult:
     """
     Publish a post to multiple social media platforms immediately
 
@@ -79,39 +297,34 @@ async def post_to_social(
             media_urls=["https://example.com/image.jpg"]
         )
     """
-    try:
-        # Validate platforms
-        invalid_platforms = [p for p in platforms if p.lower() not in SUPPORTED_PLATFORMS and p.lower() != "x"]
-        if invalid_platforms:
-            return {
-                "status": "error",
-                "message": f"Invalid platforms: {', '.join(invalid_platforms)}",
-                "supported_platforms": SUPPORTED_PLATFORMS,
-            }
-
-        # Create post
-        client = get_client()
-        response = await client.post(
-            post_text=post_text,
-            platforms=platforms,
-            media_urls=media_urls,
-            shorten_links=shorten_links,
-        )
-
-        return {
-            "status": "success",
-            "post_id": response.id,
-            "post_status": response.status,
-            "ref_id": response.refId,
-            "errors": response.errors,
-            "warnings": response.warnings,
-        }
+    # Validate platforms
+    platforms = _normalize_platforms(platforms)
+    error = _validate_platforms(platforms)
+    if error:
+        return error
+
+    # Create post
+    client = get_client()
+    response = await client.post(
+        post_text=post_text,
+        platforms=platforms,
+        media_urls=media_urls,
+        shorten_links=shorten_links,
+    )
+    _invalidate_history_cache()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post_id": response.id,
+        "post_status": response.status,
+        "ref_id": response.refId,
+        "errors": response.errors,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def schedule_post(
     post_text: str,
     platforms: List[str],
@@ -140,41 +353,40 @@ async def schedule_post(
             scheduled_date="2024-12-25T09:00:00Z"
         )
     """
-    try:
-        # Validate datetime format
-        try:
-            datetime.fromisoformat(scheduled_date.replace("Z", "+00:00"))
-        except ValueError:
-            return {
-                "status": "error",
-                "message": "Invalid date format. Use ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ",
-            }
-
-        # Create scheduled post
-        client = get_client()
-        response = await client.post(
-            post_text=post_text,
-            platforms=platforms,
-            media_urls=media_urls,
-            scheduled_date=scheduled_date,
-            shorten_links=shorten_links,
-        )
-
-        return {
-            "status": "success",
-            "post_id": response.id,
-            "scheduled_for": scheduled_date,
-            "platforms": platforms,
-            "post_status": response.status,
-            "ref_id": response.refId,
-            "warnings": response.warnings,
-        }
+    platforms = _normalize_platforms(platforms)
+    error = _validate_platforms(platforms)
+    if error:
+        return error
+
+    # Validate datetime format
+    error = _validate_scheduled_date(scheduled_date)
+    if error:
+        return error
+
+    # Create scheduled post
+    client = get_client()
+    response = await client.post(
+        post_text=post_text,
+        platforms=platforms,
+        media_urls=media_urls,
+        scheduled_date=scheduled_date,
+        shorten_links=shorten_links,
+    )
+    _invalidate_history_cache()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post_id": response.id,
+        "scheduled_for": scheduled_date,
+        "platforms": platforms,
+        "post_status": response.status,
+        "ref_id": response.refId,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_post_analytics(
     post_id: str,
     platforms: Optional[List[str]] = None,
@@ -199,25 +411,23 @@ async def get_post_analytics(
             platforms=["facebook", "twitter"]
         )
     """
-    try:
-        client = get_client()
-        analytics = await client.get_analytics_post(
-            post_id=post_id,
-            platforms=platforms,
-        )
-
-        return {
-            "status": "success",
-            "post_id": post_id,
-            "analytics": analytics.data,
-            "platforms": platforms or "all",
-        }
+    client = get_client()
+    key = (client, "post", post_id, tuple(sorted(platforms)) if platforms else None)
+    analytics = await _single_flight(
+        key,
+        lambda: client.get_analytics_post(post_id=post_id, platforms=platforms),
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post_id": post_id,
+        "analytics": analytics.data,
+        "platforms": platforms or "all",
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def delete_post(
     post_id: str,
     platforms: Optional[List[str]] = None,
@@ -239,22 +449,120 @@ async def delete_post(
             platforms=["facebook", "twitter"]
         )
     """
-    try:
-        client = get_client()
-        result = await client.delete_post(
-            post_id=post_id,
-            platforms=platforms,
-        )
+    client = get_client()
+    result = await client.delete_post(
+        post_id=post_id,
+        platforms=platforms,
+    )
+    _invalidate_history_cache()
 
-        return {
-            "status": "success",
-            "post_id": post_id,
-            "deleted_from": platforms or "all platforms",
-            "result": result,
-        }
+    return {
+        "status": "success",
+        "post_id": post_id,
+        "deleted_from": platforms or "all platforms",
+        "result": result,
+    }
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+
+# Platform capabilities are fixed at build time, so the dict (and the full
+# tool response) is assembled once at import instead of per call.
+_PLATFORM_INFO = {
+    "facebook": {
+        "name": "Facebook",
+        "supports_images": True,
+        "supports_videos": True,
+        "supports_scheduling": True,
+        "max_chars": 63206,
+    },
+    "instagram": {
+        "name": "Instagram",
+        "supports_images": True,
+        "supports_videos": True,
+        "supports_scheduling": True,
+        "max_chars": 2200,
+        "notes": "Requires business account",
+    },
+    "twitter": {
+        "name": "Twitter/X",
+        "supports_images": True,
+        "supports_videos": True,
+        "supports_scheduling": True,
+        "max_chars": 280,
+        "alternatives": ["x"],
+    },
+    "linkedin": {
+        "name": "LinkedIn",
+        "supports_images": True,
+        "supports_videos": True,
+        "supports_scheduling": True,
+        "max_chars": 3000,
+    },
+    "tiktok": {
+        "name": "TikTok",
+        "supports_images": False,
+        "supports_videos": True,
+        "supports_scheduling": True,
+        "notes": "Videos only",
+    },
+    "youtube": {
+        "name": "YouTube",
+        "supports_images": False,
+        "supports_videos": True,
+        "supports_scheduling": True,
+        "notes": "Video uploads only",
+    },
+    "pinterest": {
+        "name": "Pinterest",
+        "supports_images": True,
+        "supports_videos": True,
+        "supports_scheduling": True,
+    },
+    "reddit": {
+        "name": "Reddit",
+        "supports_images": True,
+        "supports_videos": True,
+        "supports_scheduling": True,
+    },
+    "snapchat": {
+        "name": "Snapchat",
+        "supports_images": True,
+        "supports_videos": True,
+        "supports_scheduling": True,
+    },
+    "telegram": {
+        "name": "Telegram",
+        "supports_images": True,
+        "supports_videos": True,
+        "supports_scheduling": True,
+    },
+    "threads": {
+        "name": "Threads",
+        "supports_images": True,
+        "supports_videos": True,
+        "supports_scheduling": True,
+        "max_chars": 500,
+    },
+    "bluesky": {
+        "name": "Bluesky",
+        "supports_images": True,
+        "supports_videos": False,
+        "supports_scheduling": True,
+        "max_chars": 300,
+    },
+    "gmb": {
+        "name": "Google Business Profile",
+        "supports_images": True,
+        "supports_videos": True,
+        "supports_scheduling": True,
+        "notes": "Formerly Google My Business",
+    },
+}
+
+_PLATFORM_INFO_RESPONSE = {
+    "status": "success",
+    "total_platforms": len(_PLATFORM_INFO),
+    "platforms": _PLATFORM_INFO,
+}
 
 
 @mcp.tool()
@@ -271,106 +579,11 @@ async def list_platforms() -> Dict[str, Any]:
     Example:
         list_platforms()
     """
-    platform_info = {
-        "facebook": {
-            "name": "Facebook",
-            "supports_images": True,
-            "supports_videos": True,
-            "supports_scheduling": True,
-            "max_chars": 63206,
-        },
-        "instagram": {
-            "name": "Instagram",
-            "supports_images": True,
-            "supports_videos": True,
-            "supports_scheduling": True,
-            "max_chars": 2200,
-            "notes": "Requires business account",
-        },
-        "twitter": {
-            "name": "Twitter/X",
-            "supports_images": True,
-            "supports_videos": True,
-            "supports_scheduling": True,
-            "max_chars": 280,
-            "alternatives": ["x"],
-        },
-        "linkedin": {
-            "name": "LinkedIn",
-            "supports_images": True,
-            "supports_videos": True,
-            "supports_scheduling": True,
-            "max_chars": 3000,
-        },
-        "tiktok": {
-            "name": "TikTok",
-            "supports_images": False,
-            "supports_videos": True,
-            "supports_scheduling": True,
-            "notes": "Videos only",
-        },
-        "youtube": {
-            "name": "YouTube",
-            "supports_images": False,
-            "supports_videos": True,
-            "supports_scheduling": True,
-            "notes": "Video uploads only",
-        },
-        "pinterest": {
-            "name": "Pinterest",
-            "supports_images": True,
-            "supports_videos": True,
-            "supports_scheduling": True,
-        },
-        "reddit": {
-            "name": "Reddit",
-            "supports_images": True,
-            "supports_videos": True,
-            "supports_scheduling": True,
-        },
-        "snapchat": {
-            "name": "Snapchat",
-            "supports_images": True,
-            "supports_videos": True,
-            "supports_scheduling": True,
-        },
-        "telegram": {
-            "name": "Telegram",
-            "supports_images": True,
-            "supports_videos": True,
-            "supports_scheduling": True,
-        },
-        "threads": {
-            "name": "Threads",
-            "supports_images": True,
-            "supports_videos": True,
-            "supports_scheduling": True,
-            "max_chars": 500,
-        },
-        "bluesky": {
-            "name": "Bluesky",
-            "supports_images": True,
-            "supports_videos": False,
-            "supports_scheduling": True,
-            "max_chars": 300,
-        },
-        "gmb": {
-            "name": "Google Business Profile",
-            "supports_images": True,
-            "supports_videos": True,
-            "supports_scheduling": True,
-            "notes": "Formerly Google My Business",
-        },
-    }
-
-    return {
-        "status": "success",
-        "total_platforms": len(platform_info),
-        "platforms": platform_info,
-    }
+    return _PLATFORM_INFO_RESPONSE
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_social_analytics(platforms: List[str]) -> Dict[str, Any]:
     """
     Get social network analytics across multiple platforms
@@ -388,21 +601,22 @@ async def get_social_analytics(platforms: List[str]) -> Dict[str, Any]:
     Example:
         get_social_analytics(platforms=["facebook", "instagram", "twitter"])
     """
-    try:
-        client = get_client()
-        analytics = await client.get_analytics_social(platforms=platforms)
-
-        return {
-            "status": "success",
-            "platforms": platforms,
-            "analytics": analytics.data,
-        }
+    client = get_client()
+    key = (client, "social", tuple(sorted(platforms)))
+    analytics = await _single_flight(
+        key,
+        lambda: client.get_analytics_social(platforms=platforms),
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "platforms": platforms,
+        "analytics": analytics.data,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_profile_analytics(
     platforms: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
@@ -422,26 +636,27 @@ async def get_profile_analytics(
     Example:
         get_profile_analytics(platforms=["facebook", "linkedin"])
     """
-    try:
-        client = get_client()
-        analytics = await client.get_analytics_profile(platforms=platforms)
-
-        return {
-            "status": "success",
-            "platforms": platforms or "all",
-            "analytics": analytics.data,
-        }
+    client = get_client()
+    key = (client, "profile", tuple(sorted(platforms)) if platforms else None)
+    analytics = await _single_flight(
+        key,
+        lambda: client.get_analytics_profile(platforms=platforms),
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "platforms": platforms or "all",
+        "analytics": analytics.data,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def update_post(
     post_id: str,
     post_text: Optional[str] = None,
     platforms: Optional[List[str]] = None,
-) -> Dict[str, Any]:
+) -> PostResult:
     """
     Update an existing scheduled or published post
 
@@ -460,28 +675,26 @@ async def update_post(
             platforms=["facebook", "twitter"]
         )
     """
-    try:
-        client = get_client()
-        response = await client.update_post(
-            post_id=post_id,
-            post_text=post_text,
-            platforms=platforms,
-        )
-
-        return {
-            "status": "success",
-            "post_id": response.id,
-            "post_status": response.status,
-            "updated": True,
-            "warnings": response.warnings,
-        }
+    client = get_client()
+    response = await client.update_post(
+        post_id=post_id,
+        post_text=post_text,
+        platforms=platforms,
+    )
+    _invalidate_history_cache()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post_id": response.id,
+        "post_status": response.status,
+        "updated": True,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
-async def retry_post(post_id: str) -> Dict[str, Any]:
+@ayrshare_tool
+async def retry_post(post_id: str) -> PostResult:
     """
     Retry a failed post
 
@@ -497,24 +710,22 @@ async def retry_post(post_id: str) -> Dict[str, Any]:
     Example:
         retry_post(post_id="abc123")
     """
-    try:
-        client = get_client()
-        response = await client.retry_post(post_id=post_id)
-
-        return {
-            "status": "success",
-            "post_id": response.id,
-            "post_status": response.status,
-            "retried": True,
-            "errors": response.errors,
-            "warnings": response.warnings,
-        }
+    client = get_client()
+    response = await client.retry_post(post_id=post_id)
+    _invalidate_history_cache()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post_id": response.id,
+        "post_status": response.status,
+        "retried": True,
+        "errors": response.errors,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def copy_post(
     post_id: str,
     platforms: List[str],
@@ -541,29 +752,34 @@ async def copy_post(
             scheduled_date="2024-12-26T15:00:00Z"
         )
     """
-    try:
-        client = get_client()
-        response = await client.copy_post(
-            post_id=post_id,
-            platforms=platforms,
-            scheduled_date=scheduled_date,
-        )
-
-        return {
-            "status": "success",
-            "original_post_id": post_id,
-            "new_post_id": response.id,
-            "post_status": response.status,
-            "platforms": platforms,
-            "scheduled_for": scheduled_date,
-            "warnings": response.warnings,
-        }
+    platforms = _normalize_platforms(platforms)
+    error = _validate_platforms(platforms)
+    if error is None and scheduled_date is not None:
+        error = _validate_scheduled_date(scheduled_date)
+    if error:
+        return error
+
+    client = get_client()
+    response = await client.copy_post(
+        post_id=post_id,
+        platforms=platforms,
+        scheduled_date=scheduled_date,
+    )
+    _invalidate_history_cache()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "original_post_id": post_id,
+        "new_post_id": response.id,
+        "post_status": response.status,
+        "platforms": platforms,
+        "scheduled_for": scheduled_date,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def bulk_post(posts: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Create multiple posts in a single bulk operation
@@ -593,21 +809,29 @@ async def bulk_post(posts: List[Dict[str, Any]]) -> Dict[str, Any]:
             }
         ])
     """
-    try:
-        client = get_client()
-        result = await client.bulk_post(posts=posts)
+    for entry in posts:
+        # Lowercase a throwaway copy for the check: validation stays
+        # case-insensitive like the other posting tools without mutating
+        # the caller's dicts.
+        error = _validate_platforms([p.lower() for p in entry.get("platforms") or []])
+        if error:
+            return error
 
-        return {
-            "status": "success",
-            "total_posts": len(posts),
-            "results": result,
-        }
+    client = get_client()
+    # The client sends the whole list in one /post/bulk request, so all
+    # posts share a single round trip; no per-post fan-out is needed here.
+    result = await client.bulk_post(posts=posts)
+    _invalidate_history_cache()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "total_posts": len(posts),
+        "results": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def upload_media(
     file_url: str,
     file_name: Optional[str] = None,
@@ -631,27 +855,37 @@ async def upload_media(
             file_name="summer-collection-hero.jpg"
         )
     """
-    try:
-        client = get_client()
-        result = await client.upload_media(
-            file_url=file_url,
-            file_name=file_name,
-        )
+    client = get_client()
+    result = await client.upload_media(
+        file_url=file_url,
+        file_name=file_name,
+    )
 
-        return {
-            "status": "success",
-            "uploaded": True,
-            "original_url": file_url,
-            "library_url": result.get("url"),
-            "file_name": file_name,
-            "details": result,
-        }
+    return {
+        "status": "success",
+        "uploaded": True,
+        "original_url": file_url,
+        "library_url": result.get("url"),
+        "file_name": file_name,
+        "details": result,
+    }
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+
+# Positive local HEAD verdicts for validate_media_url, keyed by URL. Only
+# conclusive probe successes are cached: failures and upstream verdicts are
+# not, so transient errors never stick for the TTL.
+_MEDIA_PROBE_TTL = 300.0
+_MEDIA_PROBE_MAX = 1024
+_media_probe_cache: Dict[str, tuple] = {}  # url -> (monotonic timestamp, verdict)
+
+# Explicit switch for the HEAD probe: on by default, disabled with
+# AYRSHARE_MEDIA_PROBE=false. The test suite turns it off so tool tests
+# never touch the network.
+_MEDIA_PROBE_ENABLED = os.getenv("AYRSHARE_MEDIA_PROBE", "true").lower() != "false"
 
 
 @mcp.tool()
+@ayrshare_tool
 async def validate_media_url(media_url: str) -> Dict[str, Any]:
     """
     Validate a media URL for accessibility and format
@@ -668,23 +902,60 @@ async def validate_media_url(media_url: str) -> Dict[str, Any]:
     Example:
         validate_media_url(media_url="https://example.com/image.jpg")
     """
-    try:
-        client = get_client()
-        result = await client.validate_media_url(media_url=media_url)
+    cached = _media_probe_cache.get(media_url)
+    if cached is not None and time.monotonic() - cached[0] < _MEDIA_PROBE_TTL:
+        return cached[1]
 
-        return {
-            "status": "success",
-            "valid": result.get("valid", True),
-            "url": media_url,
-            "issues": result.get("issues", []),
-            "details": result,
-        }
+    client = get_client()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    # Cheap local probe first: a HEAD request settles the common "URL is
+    # live and serves an image/video" case without spending an Ayrshare
+    # call. The probe rides the dedicated unauthenticated client, never the
+    # API pool, so the Ayrshare credentials are not sent to the media host.
+    # Anything inconclusive — probe failure, non-2xx, unexpected content
+    # type — falls through to the API.
+    if _MEDIA_PROBE_ENABLED:
+        try:
+            probe = await _get_probe_client().head(media_url, follow_redirects=True, timeout=5.0)
+            content_type = probe.headers.get("content-type", "")
+            if probe.is_success and content_type.startswith(("image/", "video/")):
+                verdict = {
+                    "status": "success",
+                    "valid": True,
+                    "url": media_url,
+                    "issues": [],
+                    "details": {"contentType": content_type, "source": "head_probe"},
+                }
+                if len(_media_probe_cache) >= _MEDIA_PROBE_MAX:
+                    _media_probe_cache.clear()
+                _media_probe_cache[media_url] = (time.monotonic(), verdict)
+                return verdict
+        except httpx.HTTPError:
+            pass
+
+    result = await client.validate_media_url(media_url=media_url)
+
+    return {
+        "status": "success",
+        "valid": result.get("valid", True),
+        "url": media_url,
+        "issues": result.get("issues", []),
+        "details": result,
+    }
+
+
+# Unsplash lookups are effectively immutable (an image ID never changes and
+# search results for a query are stable enough for a posting session), so
+# repeated lookups during draft/post workflows are served from memory instead
+# of a second round trip. Keyed by client so tests that mock get_client never
+# see another test's entries.
+_UNSPLASH_CACHE_TTL = 3600.0
+_UNSPLASH_CACHE_MAX = 512
+_unsplash_cache: Dict[tuple, tuple] = {}  # (client, query, image_id) -> (monotonic ts, response)
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_unsplash_image(
     query: Optional[str] = None,
     image_id: Optional[str] = None,
@@ -709,34 +980,42 @@ async def get_unsplash_image(
         # Specific image
         get_unsplash_image(image_id="HubtZZb2fCM")
     """
-    try:
-        if not query and not image_id:
-            return {
-                "status": "error",
-                "message": "Either query or image_id must be provided",
-            }
-
-        client = get_client()
-        result = await client.get_unsplash_image(
-            query=query,
-            image_id=image_id,
-        )
-
+    if not query and not image_id:
         return {
-            "status": "success",
-            "image_url": result.get("url"),
-            "query": query,
-            "image_id": image_id or result.get("id"),
-            "attribution": result.get("attribution"),
-            "photographer": result.get("photographer"),
-            "details": result,
+            "status": "error",
+            "message": "Either query or image_id must be provided",
         }
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    client = get_client()
+    cache_key = (client, query, image_id)
+    cached = _unsplash_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _UNSPLASH_CACHE_TTL:
+        return cached[1]
+
+    result = await client.get_unsplash_image(
+        query=query,
+        image_id=image_id,
+    )
+
+    response = {
+        "status": "success",
+        "image_url": result.get("url"),
+        "query": query,
+        "image_id": image_id or result.get("id"),
+        "attribution": result.get("attribution"),
+        "photographer": result.get("photographer"),
+        "details": result,
+    }
+
+    if len(_unsplash_cache) >= _UNSPLASH_CACHE_MAX:
+        _unsplash_cache.clear()
+    _unsplash_cache[cache_key] = (time.monotonic(), response)
+
+    return response
 
 
 @mcp.tool()
+@ayrshare_tool
 async def post_with_auto_hashtags(
     post_text: str,
     platforms: List[str],
@@ -767,30 +1046,33 @@ async def post_with_auto_hashtags(
             max_hashtags=3
         )
     """
-    try:
-        client = get_client()
-        response = await client.post_with_auto_hashtag(
-            post_text=post_text,
-            platforms=platforms,
-            max_hashtags=max_hashtags,
-            position=position,
-            mediaUrls=media_urls,
-        )
-
-        return {
-            "status": "success",
-            "post_id": response.id,
-            "post_status": response.status,
-            "hashtags_generated": True,
-            "max_hashtags": max_hashtags,
-            "warnings": response.warnings,
-        }
+    platforms = _normalize_platforms(platforms)
+    error = _validate_platforms(platforms)
+    if error:
+        return error
+
+    client = get_client()
+    response = await client.post_with_auto_hashtag(
+        post_text=post_text,
+        platforms=platforms,
+        max_hashtags=max_hashtags,
+        position=position,
+        mediaUrls=media_urls,
+    )
+    _invalidate_history_cache()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post_id": response.id,
+        "post_status": response.status,
+        "hashtags_generated": True,
+        "max_hashtags": max_hashtags,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def create_evergreen_post(
     post_text: str,
     platforms: List[str],
@@ -825,33 +1107,38 @@ async def create_evergreen_post(
             start_date="2024-12-25T09:00:00Z"
         )
     """
-    try:
-        client = get_client()
-        response = await client.post_evergreen(
-            post_text=post_text,
-            platforms=platforms,
-            repeat=repeat,
-            days_between=days_between,
-            start_date=start_date,
-            mediaUrls=media_urls,
-        )
-
-        return {
-            "status": "success",
-            "post_id": response.id,
-            "post_status": response.status,
-            "evergreen": True,
-            "repeat_count": repeat,
-            "days_between": days_between,
-            "start_date": start_date,
-            "warnings": response.warnings,
-        }
+    platforms = _normalize_platforms(platforms)
+    error = _validate_platforms(platforms)
+    if error is None and start_date is not None:
+        error = _validate_scheduled_date(start_date)
+    if error:
+        return error
+
+    client = get_client()
+    response = await client.post_evergreen(
+        post_text=post_text,
+        platforms=platforms,
+        repeat=repeat,
+        days_between=days_between,
+        start_date=start_date,
+        mediaUrls=media_urls,
+    )
+    _invalidate_history_cache()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post_id": response.id,
+        "post_status": response.status,
+        "evergreen": True,
+        "repeat_count": repeat,
+        "days_between": days_between,
+        "start_date": start_date,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def post_with_first_comment(
     post_text: str,
     platforms: List[str],
@@ -883,30 +1170,33 @@ async def post_with_first_comment(
             comment_media_urls=["https://example.com/blog-preview.jpg"]
         )
     """
-    try:
-        client = get_client()
-        response = await client.post_with_first_comment(
-            post_text=post_text,
-            platforms=platforms,
-            first_comment=first_comment,
-            comment_media_urls=comment_media_urls,
-            mediaUrls=media_urls,
-        )
-
-        return {
-            "status": "success",
-            "post_id": response.id,
-            "post_status": response.status,
-            "first_comment_added": True,
-            "comment_text": first_comment,
-            "warnings": response.warnings,
-        }
+    platforms = _normalize_platforms(platforms)
+    error = _validate_platforms(platforms)
+    if error:
+        return error
+
+    client = get_client()
+    response = await client.post_with_first_comment(
+        post_text=post_text,
+        platforms=platforms,
+        first_comment=first_comment,
+        comment_media_urls=comment_media_urls,
+        mediaUrls=media_urls,
+    )
+    _invalidate_history_cache()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post_id": response.id,
+        "post_status": response.status,
+        "first_comment_added": True,
+        "comment_text": first_comment,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def submit_post_for_approval(
     post_text: str,
     platforms: List[str],
@@ -938,32 +1228,37 @@ async def submit_post_for_approval(
             scheduled_date="2024-12-25T10:00:00Z"
         )
     """
-    try:
-        client = get_client()
-        response = await client.post_with_approval(
-            post_text=post_text,
-            platforms=platforms,
-            notes=notes,
-            mediaUrls=media_urls,
-            scheduleDate=scheduled_date,
-        )
-
-        return {
-            "status": "success",
-            "post_id": response.id,
-            "post_status": "awaiting_approval",
-            "platforms": platforms,
-            "notes": notes,
-            "scheduled_date": scheduled_date,
-            "warnings": response.warnings,
-        }
+    platforms = _normalize_platforms(platforms)
+    error = _validate_platforms(platforms)
+    if error is None and scheduled_date is not None:
+        error = _validate_scheduled_date(scheduled_date)
+    if error:
+        return error
+
+    client = get_client()
+    response = await client.post_with_approval(
+        post_text=post_text,
+        platforms=platforms,
+        notes=notes,
+        mediaUrls=media_urls,
+        scheduleDate=scheduled_date,
+    )
+    _invalidate_history_cache()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post_id": response.id,
+        "post_status": "awaiting_approval",
+        "platforms": platforms,
+        "notes": notes,
+        "scheduled_date": scheduled_date,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
-async def approve_post(post_id: str) -> Dict[str, Any]:
+@ayrshare_tool
+async def approve_post(post_id: str) -> PostResult:
     """
     Approve a post that is awaiting approval
 
@@ -979,20 +1274,51 @@ async def approve_post(post_id: str) -> Dict[str, Any]:
     Example:
         approve_post(post_id="abc123")
     """
-    try:
-        client = get_client()
-        response = await client.approve_post(post_id=post_id)
+    client = get_client()
+    response = await client.approve_post(post_id=post_id)
+    _invalidate_history_cache()
 
-        return {
-            "status": "success",
-            "post_id": response.id,
-            "post_status": response.status,
-            "approved": True,
-            "warnings": response.warnings,
-        }
+    return {
+        "status": "success",
+        "post_id": response.id,
+        "post_status": response.status,
+        "approved": True,
+        "warnings": response.warnings,
+    }
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+
+# MCP clients poll ayrshare://history far more often than posts change, so
+# the formatted text is cached for a minute and dropped whenever a tool
+# mutates posts. The entry remembers which client produced it so a swapped
+# client (reconfiguration, tests) never serves stale text.
+_HISTORY_CACHE_TTL = 60.0
+_history_cache: Optional[tuple] = None  # (client, monotonic timestamp, text)
+
+
+def _invalidate_history_cache() -> None:
+    # The analytics dashboard is derived from the same history data, so it
+    # drops together with the history text whenever a tool mutates posts.
+    global _history_cache
+    _history_cache = None
+    _dashboard_cache.clear()
+
+
+def _format_history_post(post: Dict[str, Any]) -> str:
+    """Render one history entry as a markdown block (one string build per post)"""
+    block = (
+        f"## Post ID: {post.get('id', 'N/A')}\n"
+        f"Status: {post.get('status', 'N/A')}\n"
+        f"Platforms: {', '.join(post.get('platforms', []))}\n"
+        f"Created: {post.get('created', 'N/A')}"
+    )
+
+    if post.get("post"):
+        block += f"\nContent: {post['post'][:100]}..."
+
+    if post.get("scheduled"):
+        block += f"\nScheduled for: {post['scheduled']}"
+
+    return block
 
 
 @mcp.resource("ayrshare://history")
@@ -1002,35 +1328,58 @@ async def get_post_history() -> str:
 
     Returns the last 30 days of posts across all connected platforms,
     including post content, status, platforms, and engagement metrics.
+    Reads are served from a short-lived cache that post-mutating tools
+    invalidate, so polling clients don't re-fetch unchanged history.
     """
+    global _history_cache
     try:
         client = get_client()
-        history = await client.get_history(last_days=30)
-
-        if not history:
-            return "No posts found in the last 30 days."
 
-        # Format history as readable text
-        result = ["# Post History (Last 30 Days)\n"]
+        cached = _history_cache
+        if (
+            cached is not None
+            and cached[0] is client
+            and time.monotonic() - cached[1] < _HISTORY_CACHE_TTL
+        ):
+            return cached[2]
 
-        for post in history:
-            result.append(f"## Post ID: {post.get('id', 'N/A')}")
-            result.append(f"Status: {post.get('status', 'N/A')}")
-            result.append(f"Platforms: {', '.join(post.get('platforms', []))}")
-            result.append(f"Created: {post.get('created', 'N/A')}")
+        history = await client.get_history(last_days=30)
 
-            if post.get("post"):
-                result.append(f"Content: {post['post'][:100]}...")
+        if not history:
+            text = "No posts found in the last 30 days."
+        else:
+            # One string per post fed straight into a single join, instead of
+            # growing a list line by line across the whole history.
+            text = (
+                "# Post History (Last 30 Days)\n\n"
+                + "\n\n".join(_format_history_post(post) for post in history)
+                + "\n"
+            )
+
+        _history_cache = (client, time.monotonic(), text)
+        return text
 
-            if post.get("scheduled"):
-                result.append(f"Scheduled for: {post['scheduled']}")
+    except AyrshareError as e:
+        return f"Error fetching history: {str(e)}"
 
-            result.append("")  # Blank line
 
-        return "\n".join(result)
+def _format_profile(profile: Dict[str, Any]) -> str:
+    """Render one profile as a markdown block (one string per profile, not per line)"""
+    platforms = profile.get("connectedAccounts", [])
+    if platforms:
+        accounts = "\n".join(
+            f"  - {p.get('platform', 'Unknown')}: {p.get('account', '')} ({p.get('status', 'unknown')})"
+            for p in platforms
+        )
+        body = f"Connected Platforms ({len(platforms)}):\n{accounts}"
+    else:
+        body = "No platforms connected to this profile."
 
-    except AyrshareError as e:
-        return f"Error fetching history: {str(e)}"
+    return (
+        f"## Profile: {profile.get('title', 'Unnamed Profile')}\n"
+        f"Profile Key: {profile.get('profileKey', 'N/A')}\n"
+        f"{body}\n"
+    )
 
 
 @mcp.resource("ayrshare://platforms")
@@ -1048,97 +1397,70 @@ async def get_connected_platforms() -> str:
         if not profiles:
             return "No connected profiles found. Please connect social media accounts in the Ayrshare dashboard."
 
-        # Format profiles as readable text
-        result = ["# Connected Social Media Profiles\n"]
-
-        for profile in profiles:
-            result.append(f"## Profile: {profile.get('title', 'Unnamed Profile')}")
-            result.append(f"Profile Key: {profile.get('profileKey', 'N/A')}")
-
-            platforms = profile.get("connectedAccounts", [])
-            if platforms:
-                result.append(f"Connected Platforms ({len(platforms)}):")
-                for platform in platforms:
-                    platform_name = platform.get("platform", "Unknown")
-                    account = platform.get("account", "")
-                    status = platform.get("status", "unknown")
-                    result.append(f"  - {platform_name}: {account} ({status})")
-            else:
-                result.append("No platforms connected to this profile.")
-
-            result.append("")  # Blank line
-
-        return "\n".join(result)
+        # One pre-built block per profile keeps the final join short instead
+        # of accumulating every line individually.
+        lines = ["# Connected Social Media Profiles\n"]
+        lines.extend(_format_profile(profile) for profile in profiles)
+        return "\n".join(lines)
 
     except AyrshareError as e:
         return f"Error fetching profiles: {str(e)}"
 
 
-@mcp.prompt()
-def optimize_for_platform(post_content: str, target_platform: str) -> str:
-    """
-    Generate platform-optimized social media post
-
-    Creates a prompt for an LLM to optimize post content for a specific social media
-    platform, considering character limits, hashtag best practices, and platform culture.
-
-    Args:
-        post_content: The original post content to optimize
-        target_platform: The target platform (facebook, twitter, linkedin, instagram, etc.)
-
-    Returns:
-        Prompt string for LLM to generate optimized content
-    """
-    platform_specs = {
-        "twitter": {
-            "char_limit": 280,
-            "tone": "conversational and concise",
-            "hashtags": "1-2 relevant hashtags",
-            "style": "punchy and engaging",
-        },
-        "facebook": {
-            "char_limit": 63206,
-            "tone": "friendly and personal",
-            "hashtags": "minimal, focus on storytelling",
-            "style": "detailed and engaging",
-        },
-        "linkedin": {
-            "char_limit": 3000,
-            "tone": "professional and insightful",
-            "hashtags": "3-5 professional hashtags",
-            "style": "thought leadership and value-driven",
-        },
-        "instagram": {
-            "char_limit": 2200,
-            "tone": "visual-first with engaging caption",
-            "hashtags": "10-30 relevant hashtags",
-            "style": "storytelling with emoji support",
-        },
-        "tiktok": {
-            "char_limit": 2200,
-            "tone": "fun, trendy, authentic",
-            "hashtags": "3-5 trending hashtags",
-            "style": "attention-grabbing and relatable",
-        },
-    }
-
-    specs = platform_specs.get(target_platform.lower(), {
-        "char_limit": 2000,
-        "tone": "engaging and platform-appropriate",
-        "hashtags": "2-5 relevant hashtags",
-        "style": "clear and compelling",
-    })
-
-    return f"""Optimize this social media post for {target_platform}:
+# Per-platform prompt guidance, built once at import instead of as dict
+# literals inside optimize_for_platform on every invocation.
+_PLATFORM_SPECS = {
+    "twitter": {
+        "char_limit": 280,
+        "tone": "conversational and concise",
+        "hashtags": "1-2 relevant hashtags",
+        "style": "punchy and engaging",
+    },
+    "facebook": {
+        "char_limit": 63206,
+        "tone": "friendly and personal",
+        "hashtags": "minimal, focus on storytelling",
+        "style": "detailed and engaging",
+    },
+    "linkedin": {
+        "char_limit": 3000,
+        "tone": "professional and insightful",
+        "hashtags": "3-5 professional hashtags",
+        "style": "thought leadership and value-driven",
+    },
+    "instagram": {
+        "char_limit": 2200,
+        "tone": "visual-first with engaging caption",
+        "hashtags": "10-30 relevant hashtags",
+        "style": "storytelling with emoji support",
+    },
+    "tiktok": {
+        "char_limit": 2200,
+        "tone": "fun, trendy, authentic",
+        "hashtags": "3-5 trending hashtags",
+        "style": "attention-grabbing and relatable",
+    },
+}
+
+_DEFAULT_PLATFORM_SPEC = {
+    "char_limit": 2000,
+    "tone": "engaging and platform-appropriate",
+    "hashtags": "2-5 relevant hashtags",
+    "style": "clear and compelling",
+}
+
+# Prompt templates live at module level so each invocation is a single
+# .format() over a shared literal instead of rebuilding the full text.
+_OPTIMIZE_PROMPT = """Optimize this social media post for {platform}:
 
 Original Content:
-{post_content}
+{content}
 
-Platform Requirements for {target_platform}:
-- Character Limit: {specs['char_limit']}
-- Tone: {specs['tone']}
-- Hashtag Strategy: {specs['hashtags']}
-- Style: {specs['style']}
+Platform Requirements for {platform}:
+- Character Limit: {char_limit}
+- Tone: {tone}
+- Hashtag Strategy: {hashtags}
+- Style: {style}
 
 Please create an optimized version that:
 1. Fits within the character limit
@@ -1149,29 +1471,10 @@ Please create an optimized version that:
 
 Return ONLY the optimized post content, ready to publish."""
 
-
-@mcp.prompt()
-def generate_hashtags(post_content: str, target_platforms: List[str], max_hashtags: int = 5) -> str:
-    """
-    Generate relevant hashtags for social media post
-
-    Creates a prompt for an LLM to generate platform-appropriate hashtags
-    based on post content and target platforms.
-
-    Args:
-        post_content: The post content to generate hashtags for
-        target_platforms: List of target platforms
-        max_hashtags: Maximum number of hashtags to generate (default: 5)
-
-    Returns:
-        Prompt string for LLM to generate hashtags
-    """
-    platform_list = ", ".join(target_platforms)
-
-    return f"""Generate relevant hashtags for this social media post:
+_HASHTAGS_PROMPT = """Generate relevant hashtags for this social media post:
 
 Post Content:
-{post_content}
+{content}
 
 Target Platforms: {platform_list}
 Maximum Hashtags: {max_hashtags}
@@ -1188,36 +1491,7 @@ Return hashtags in this format:
 
 Focus on hashtags that will maximize reach and engagement on {platform_list}."""
 
-
-@mcp.prompt()
-def schedule_campaign(
-    campaign_name: str,
-    start_date: str,
-    end_date: str,
-    post_frequency: str,
-    platforms: List[str],
-    campaign_goals: str,
-) -> str:
-    """
-    Generate social media campaign schedule
-
-    Creates a prompt for an LLM to generate a comprehensive posting schedule
-    for a social media campaign across multiple platforms.
-
-    Args:
-        campaign_name: Name of the campaign
-        start_date: Campaign start date (YYYY-MM-DD)
-        end_date: Campaign end date (YYYY-MM-DD)
-        post_frequency: Posting frequency (e.g., "daily", "twice daily", "3x per week")
-        platforms: List of target platforms
-        campaign_goals: Campaign objectives and goals
-
-    Returns:
-        Prompt string for LLM to generate campaign schedule
-    """
-    platform_list = ", ".join(platforms)
-
-    return f"""Create a detailed social media campaign schedule:
+_CAMPAIGN_PROMPT = """Create a detailed social media campaign schedule:
 
 Campaign Details:
 - Name: {campaign_name}
@@ -1258,13 +1532,96 @@ Format the schedule as a detailed calendar with:
 Focus on achieving: {campaign_goals}"""
 
 
+@mcp.prompt()
+def optimize_for_platform(post_content: str, target_platform: str) -> str:
+    """
+    Generate platform-optimized social media post
+
+    Creates a prompt for an LLM to optimize post content for a specific social media
+    platform, considering character limits, hashtag best practices, and platform culture.
+
+    Args:
+        post_content: The original post content to optimize
+        target_platform: The target platform (facebook, twitter, linkedin, instagram, etc.)
+
+    Returns:
+        Prompt string for LLM to generate optimized content
+    """
+    # casefold matches lower for these ASCII keys but is the canonical
+    # caseless-lookup normalization, so exotic input still degrades to the
+    # default spec rather than a KeyError path.
+    specs = _PLATFORM_SPECS.get(target_platform.casefold(), _DEFAULT_PLATFORM_SPEC)
+
+    return _OPTIMIZE_PROMPT.format(platform=target_platform, content=post_content, **specs)
+
+
+@mcp.prompt()
+def generate_hashtags(post_content: str, target_platforms: List[str], max_hashtags: int = 5) -> str:
+    """
+    Generate relevant hashtags for social media post
+
+    Creates a prompt for an LLM to generate platform-appropriate hashtags
+    based on post content and target platforms.
+
+    Args:
+        post_content: The post content to generate hashtags for
+        target_platforms: List of target platforms
+        max_hashtags: Maximum number of hashtags to generate (default: 5)
+
+    Returns:
+        Prompt string for LLM to generate hashtags
+    """
+    return _HASHTAGS_PROMPT.format(
+        content=post_content,
+        platform_list=", ".join(target_platforms),
+        max_hashtags=max_hashtags,
+    )
+
+
+@mcp.prompt()
+def schedule_campaign(
+    campaign_name: str,
+    start_date: str,
+    end_date: str,
+    post_frequency: str,
+    platforms: List[str],
+    campaign_goals: str,
+) -> str:
+    """
+    Generate social media campaign schedule
+
+    Creates a prompt for an LLM to generate a comprehensive posting schedule
+    for a social media campaign across multiple platforms.
+
+    Args:
+        campaign_name: Name of the campaign
+        start_date: Campaign start date (YYYY-MM-DD)
+        end_date: Campaign end date (YYYY-MM-DD)
+        post_frequency: Posting frequency (e.g., "daily", "twice daily", "3x per week")
+        platforms: List of target platforms
+        campaign_goals: Campaign objectives and goals
+
+    Returns:
+        Prompt string for LLM to generate campaign schedule
+    """
+    return _CAMPAIGN_PROMPT.format(
+        campaign_name=campaign_name,
+        start_date=start_date,
+        end_date=end_date,
+        post_frequency=post_frequency,
+        platform_list=", ".join(platforms),
+        campaign_goals=campaign_goals,
+    )
+
+
 # Comments API Tools
 
 @mcp.tool()
+@ayrshare_tool
 async def get_post_comments(
     post_id: str,
     platforms: Optional[List[str]] = None,
-) -> Dict[str, Any]:
+) -> CommentResult:
     """
     Get comments on a specific social media post
 
@@ -1285,31 +1642,28 @@ async def get_post_comments(
             platforms=["facebook", "twitter"]
         )
     """
-    try:
-        client = get_client()
-        comments = await client.get_comments(
-            post_id=post_id,
-            platforms=platforms,
-        )
-
-        return {
-            "status": "success",
-            "post_id": post_id,
-            "total_comments": len(comments),
-            "comments": comments,
-            "platforms": platforms or "all",
-        }
+    client = get_client()
+    comments = await client.get_comments(
+        post_id=post_id,
+        platforms=platforms,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post_id": post_id,
+        "total_comments": len(comments),
+        "comments": comments,
+        "platforms": platforms or "all",
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def add_comment_to_post(
     post_id: str,
     comment_text: str,
     platforms: Optional[List[str]] = None,
-) -> Dict[str, Any]:
+) -> CommentResult:
     """
     Add a comment to a social media post
 
@@ -1330,32 +1684,29 @@ async def add_comment_to_post(
             platforms=["facebook", "linkedin"]
         )
     """
-    try:
-        client = get_client()
-        response = await client.add_comment(
-            post_id=post_id,
-            comment_text=comment_text,
-            platforms=platforms,
-        )
+    client = get_client()
+    response = await client.add_comment(
+        post_id=post_id,
+        comment_text=comment_text,
+        platforms=platforms,
+    )
 
-        return {
-            "status": "success",
-            "comment_id": response.id,
-            "post_id": post_id,
-            "platforms": platforms or "all",
-            "warnings": response.warnings,
-        }
-
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "comment_id": response.id,
+        "post_id": post_id,
+        "platforms": platforms or "all",
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def reply_to_comment(
     comment_id: str,
     reply_text: str,
     platform: str,
-) -> Dict[str, Any]:
+) -> CommentResult:
     """
     Reply to an existing comment on a social media post
 
@@ -1376,31 +1727,28 @@ async def reply_to_comment(
             platform="facebook"
         )
     """
-    try:
-        client = get_client()
-        response = await client.reply_to_comment(
-            comment_id=comment_id,
-            reply_text=reply_text,
-            platform=platform,
-        )
-
-        return {
-            "status": "success",
-            "reply_id": response.id,
-            "comment_id": comment_id,
-            "platform": platform,
-            "warnings": response.warnings,
-        }
+    client = get_client()
+    response = await client.reply_to_comment(
+        comment_id=comment_id,
+        reply_text=reply_text,
+        platform=platform,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "reply_id": response.id,
+        "comment_id": comment_id,
+        "platform": platform,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def delete_post_comment(
     comment_id: str,
     platforms: Optional[List[str]] = None,
-) -> Dict[str, Any]:
+) -> CommentResult:
     """
     Delete a comment from social media platforms
 
@@ -1419,27 +1767,24 @@ async def delete_post_comment(
             platforms=["facebook", "twitter"]
         )
     """
-    try:
-        client = get_client()
-        result = await client.delete_comment(
-            comment_id=comment_id,
-            platforms=platforms,
-        )
+    client = get_client()
+    result = await client.delete_comment(
+        comment_id=comment_id,
+        platforms=platforms,
+    )
 
-        return {
-            "status": "success",
-            "comment_id": comment_id,
-            "deleted_from": platforms or "all platforms",
-            "result": result,
-        }
-
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "comment_id": comment_id,
+        "deleted_from": platforms or "all platforms",
+        "result": result,
+    }
 
 
 # Messages API Tools (Business Plan)
 
 @mcp.tool()
+@ayrshare_tool
 async def send_direct_message(
     platform: str,
     recipient_id: str,
@@ -1470,28 +1815,25 @@ async def send_direct_message(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        response = await client.send_message(
-            platform=platform,
-            recipient_id=recipient_id,
-            message=message,
-            media_urls=media_urls,
-        )
-
-        return {
-            "status": "success",
-            "message_id": response.id,
-            "platform": platform,
-            "recipient_id": recipient_id,
-            "warnings": response.warnings,
-        }
+    client = get_client()
+    response = await client.send_message(
+        platform=platform,
+        recipient_id=recipient_id,
+        message=message,
+        media_urls=media_urls,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "message_id": response.id,
+        "platform": platform,
+        "recipient_id": recipient_id,
+        "warnings": response.warnings,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_message_conversations(
     platform: str,
     limit: Optional[int] = None,
@@ -1516,25 +1858,22 @@ async def get_message_conversations(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        conversations = await client.get_conversations(
-            platform=platform,
-            limit=limit,
-        )
+    client = get_client()
+    conversations = await client.get_conversations(
+        platform=platform,
+        limit=limit,
+    )
 
-        return {
-            "status": "success",
-            "platform": platform,
-            "total_conversations": len(conversations),
-            "conversations": conversations,
-        }
-
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "platform": platform,
+        "total_conversations": len(conversations),
+        "conversations": conversations,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_conversation_history(
     conversation_id: str,
     platform: str,
@@ -1562,27 +1901,24 @@ async def get_conversation_history(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        messages = await client.get_conversation_messages(
-            conversation_id=conversation_id,
-            platform=platform,
-            limit=limit,
-        )
-
-        return {
-            "status": "success",
-            "conversation_id": conversation_id,
-            "platform": platform,
-            "total_messages": len(messages),
-            "messages": messages,
-        }
+    client = get_client()
+    messages = await client.get_conversation_messages(
+        conversation_id=conversation_id,
+        platform=platform,
+        limit=limit,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "conversation_id": conversation_id,
+        "platform": platform,
+        "total_messages": len(messages),
+        "messages": messages,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def mark_messages_as_read(
     message_ids: List[str],
     platform: str,
@@ -1607,27 +1943,24 @@ async def mark_messages_as_read(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        result = await client.mark_messages_read(
-            message_ids=message_ids,
-            platform=platform,
-        )
-
-        return {
-            "status": "success",
-            "marked_read": len(message_ids),
-            "platform": platform,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.mark_messages_read(
+        message_ids=message_ids,
+        platform=platform,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "marked_read": len(message_ids),
+        "platform": platform,
+        "result": result,
+    }
 
 
 # Reviews API Tools (Google Business Profile)
 
 @mcp.tool()
+@ayrshare_tool
 async def get_google_business_reviews(
     location_id: Optional[str] = None,
 ) -> Dict[str, Any]:
@@ -1647,22 +1980,19 @@ async def get_google_business_reviews(
             location_id="location_12345"
         )
     """
-    try:
-        client = get_client()
-        reviews = await client.get_reviews(location_id=location_id)
+    client = get_client()
+    reviews = await client.get_reviews(location_id=location_id)
 
-        return {
-            "status": "success",
-            "total_reviews": len(reviews),
-            "reviews": reviews,
-            "location_id": location_id or "all",
-        }
-
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "total_reviews": len(reviews),
+        "reviews": reviews,
+        "location_id": location_id or "all",
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def respond_to_review(
     review_id: str,
     response_text: str,
@@ -1685,25 +2015,22 @@ async def respond_to_review(
             response_text="Thank you for your feedback! We're glad you enjoyed our service."
         )
     """
-    try:
-        client = get_client()
-        result = await client.reply_to_review(
-            review_id=review_id,
-            response_text=response_text,
-        )
-
-        return {
-            "status": "success",
-            "review_id": review_id,
-            "responded": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.reply_to_review(
+        review_id=review_id,
+        response_text=response_text,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "review_id": review_id,
+        "responded": True,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def remove_review_response(
     review_id: str,
 ) -> Dict[str, Any]:
@@ -1721,24 +2048,21 @@ async def remove_review_response(
     Example:
         remove_review_response(review_id="review_12345")
     """
-    try:
-        client = get_client()
-        result = await client.delete_review_response(review_id=review_id)
+    client = get_client()
+    result = await client.delete_review_response(review_id=review_id)
 
-        return {
-            "status": "success",
-            "review_id": review_id,
-            "response_deleted": True,
-            "result": result,
-        }
-
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "review_id": review_id,
+        "response_deleted": True,
+        "result": result,
+    }
 
 
 # Webhooks API Tools (Business Plan)
 
 @mcp.tool()
+@ayrshare_tool
 async def setup_webhook_endpoint(
     url: str,
     events: List[str],
@@ -1761,28 +2085,25 @@ async def setup_webhook_endpoint(
             events=["post.published", "post.failed", "comment.added"]
         )
 
-    Note: Requires Ayrshare Business Plan
-    """
-    try:
-        client = get_client()
-        result = await client.create_webhook(
-            url=url,
-            events=events,
-        )
-
-        return {
-            "status": "success",
-            "webhook_id": result.get("id"),
-            "url": url,
-            "events": events,
-            "result": result,
-        }
-
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    Note: Requires Ayrshare Business Plan
+    """
+    client = get_client()
+    result = await client.create_webhook(
+        url=url,
+        events=events,
+    )
+
+    return {
+        "status": "success",
+        "webhook_id": result.get("id"),
+        "url": url,
+        "events": events,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def list_webhook_subscriptions() -> Dict[str, Any]:
     """
     List configured webhooks (Business Plan required)
@@ -1797,21 +2118,18 @@ async def list_webhook_subscriptions() -> Dict[str, Any]:
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        webhooks = await client.list_webhooks()
-
-        return {
-            "status": "success",
-            "total_webhooks": len(webhooks),
-            "webhooks": webhooks,
-        }
+    client = get_client()
+    webhooks = await client.list_webhooks()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "total_webhooks": len(webhooks),
+        "webhooks": webhooks,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def update_webhook_configuration(
     webhook_id: str,
     url: Optional[str] = None,
@@ -1839,26 +2157,90 @@ async def update_webhook_configuration(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        result = await client.update_webhook(
-            webhook_id=webhook_id,
-            url=url,
-            events=events,
+    client = get_client()
+    result = await client.update_webhook(
+        webhook_id=webhook_id,
+        url=url,
+        events=events,
+    )
+
+    return {
+        "status": "success",
+        "webhook_id": webhook_id,
+        "updated": True,
+        "result": result,
+    }
+
+
+@mcp.tool()
+@ayrshare_tool
+async def bulk_update_webhooks(
+    updates: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Update multiple webhook configurations concurrently (Business Plan required)
+
+    Reconcile many webhooks in one call instead of looping over
+    update_webhook_configuration: the updates are issued concurrently
+    (bounded by the client's concurrency gate), so N webhooks cost roughly
+    one round trip rather than N sequential ones.
+
+    Args:
+        updates: List of update dicts, each with a "webhook_id" key and
+                optional "url" and/or "events" keys (the same fields as
+                update_webhook_configuration)
+
+    Returns:
+        Dictionary with per-webhook update results and any errors
+
+    Example:
+        bulk_update_webhooks(
+            updates=[
+                {"webhook_id": "webhook_123", "url": "https://myserver.com/hooks"},
+                {"webhook_id": "webhook_456", "events": ["post.published"]},
+            ]
         )
 
-        return {
-            "status": "success",
-            "webhook_id": webhook_id,
-            "updated": True,
-            "result": result,
-        }
+    Note: Requires Ayrshare Business Plan
+    """
+    errors = []
+    valid = []
+    for update in updates:
+        if update.get("webhook_id"):
+            valid.append(update)
+        else:
+            errors.append({"webhook_id": None, "error": "webhook_id is required"})
+
+    client = get_client()
+    results = await asyncio.gather(
+        *(
+            client.update_webhook(
+                webhook_id=update["webhook_id"],
+                url=update.get("url"),
+                events=update.get("events"),
+            )
+            for update in valid
+        ),
+        return_exceptions=True,
+    )
+
+    updated = []
+    for update, result in zip(valid, results):
+        if isinstance(result, BaseException):
+            errors.append({"webhook_id": update["webhook_id"], "error": str(result)})
+        else:
+            updated.append({"webhook_id": update["webhook_id"], "result": result})
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success" if not errors else "partial",
+        "total_updated": len(updated),
+        "updated": updated,
+        "errors": errors,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def remove_webhook(
     webhook_id: str,
 ) -> Dict[str, Any]:
@@ -1878,24 +2260,21 @@ async def remove_webhook(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        result = await client.delete_webhook(webhook_id=webhook_id)
-
-        return {
-            "status": "success",
-            "webhook_id": webhook_id,
-            "deleted": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.delete_webhook(webhook_id=webhook_id)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "webhook_id": webhook_id,
+        "deleted": True,
+        "result": result,
+    }
 
 
 # Links API Tools (Max Pack Add-on)
 
 @mcp.tool()
+@ayrshare_tool
 async def shorten_url(
     url: str,
     custom_slug: Optional[str] = None,
@@ -1920,27 +2299,24 @@ async def shorten_url(
 
     Note: Requires Ayrshare Max Pack Add-on
     """
-    try:
-        client = get_client()
-        result = await client.shorten_link(
-            url=url,
-            custom_slug=custom_slug,
-        )
+    client = get_client()
+    result = await client.shorten_link(
+        url=url,
+        custom_slug=custom_slug,
+    )
 
-        return {
-            "status": "success",
-            "original_url": url,
-            "shortened_url": result.get("shortUrl"),
-            "link_id": result.get("id"),
-            "custom_slug": custom_slug,
-            "result": result,
-        }
-
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "original_url": url,
+        "shortened_url": result.get("shortUrl"),
+        "link_id": result.get("id"),
+        "custom_slug": custom_slug,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_link_analytics(
     link_id: str,
 ) -> Dict[str, Any]:
@@ -1960,23 +2336,20 @@ async def get_link_analytics(
 
     Note: Requires Ayrshare Max Pack Add-on
     """
-    try:
-        client = get_client()
-        analytics = await client.get_link_analytics(link_id=link_id)
-
-        return {
-            "status": "success",
-            "link_id": link_id,
-            "analytics": analytics,
-        }
+    client = get_client()
+    analytics = await client.get_link_analytics(link_id=link_id)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "link_id": link_id,
+        "analytics": analytics,
+    }
 
 
 # Ads API Tools (Business Plan)
 
 @mcp.tool()
+@ayrshare_tool
 async def create_ad_from_post(
     post_id: str,
     budget: float,
@@ -2012,29 +2385,26 @@ async def create_ad_from_post(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        result = await client.create_ad(
-            post_id=post_id,
-            budget=budget,
-            duration=duration,
-            targeting=targeting,
-        )
-
-        return {
-            "status": "success",
-            "ad_id": result.get("id"),
-            "post_id": post_id,
-            "budget": budget,
-            "duration": duration,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.create_ad(
+        post_id=post_id,
+        budget=budget,
+        duration=duration,
+        targeting=targeting,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "ad_id": result.get("id"),
+        "post_id": post_id,
+        "budget": budget,
+        "duration": duration,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_ad_analytics(
     ad_id: str,
 ) -> Dict[str, Any]:
@@ -2054,21 +2424,18 @@ async def get_ad_analytics(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        analytics = await client.get_ad_analytics(ad_id=ad_id)
-
-        return {
-            "status": "success",
-            "ad_id": ad_id,
-            "analytics": analytics,
-        }
+    client = get_client()
+    analytics = await client.get_ad_analytics(ad_id=ad_id)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "ad_id": ad_id,
+        "analytics": analytics,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def manage_ad_campaign(
     ad_id: str,
     budget: Optional[float] = None,
@@ -2096,28 +2463,25 @@ async def manage_ad_campaign(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        result = await client.update_ad(
-            ad_id=ad_id,
-            budget=budget,
-            status=status,
-        )
-
-        return {
-            "status": "success",
-            "ad_id": ad_id,
-            "updated": True,
-            "new_budget": budget,
-            "new_status": status,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.update_ad(
+        ad_id=ad_id,
+        budget=budget,
+        status=status,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "ad_id": ad_id,
+        "updated": True,
+        "new_budget": budget,
+        "new_status": status,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def stop_ad_campaign(
     ad_id: str,
 ) -> Dict[str, Any]:
@@ -2137,24 +2501,21 @@ async def stop_ad_campaign(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        result = await client.delete_ad(ad_id=ad_id)
-
-        return {
-            "status": "success",
-            "ad_id": ad_id,
-            "stopped": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.delete_ad(ad_id=ad_id)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "ad_id": ad_id,
+        "stopped": True,
+        "result": result,
+    }
 
 
 # Profiles API Tools (Business Plan)
 
 @mcp.tool()
+@ayrshare_tool
 async def create_user_profile(
     title: str,
     messaging_active: Optional[bool] = None,
@@ -2188,29 +2549,26 @@ async def create_user_profile(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        result = await client.create_profile(
-            title=title,
-            messaging_active=messaging_active,
-            team=team,
-            email=email,
-            disable_social=disable_social,
-            tags=tags,
-        )
-
-        return {
-            "status": "success",
-            "profile_key": result.get("profileKey"),
-            "title": title,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.create_profile(
+        title=title,
+        messaging_active=messaging_active,
+        team=team,
+        email=email,
+        disable_social=disable_social,
+        tags=tags,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "profile_key": result.get("profileKey"),
+        "title": title,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def list_user_profiles(
     title: Optional[str] = None,
     ref_id: Optional[str] = None,
@@ -2239,27 +2597,24 @@ async def list_user_profiles(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        profiles = await client.list_profiles(
-            title=title,
-            ref_id=ref_id,
-            has_active_social=has_active_social,
-            includes_active_social=includes_active_social,
-            limit=limit,
-        )
-
-        return {
-            "status": "success",
-            "total_profiles": len(profiles),
-            "profiles": profiles,
-        }
+    client = get_client()
+    profiles = await client.list_profiles(
+        title=title,
+        ref_id=ref_id,
+        has_active_social=has_active_social,
+        includes_active_social=includes_active_social,
+        limit=limit,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "total_profiles": len(profiles),
+        "profiles": profiles,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_user_profile_details(
     profile_key: str,
 ) -> Dict[str, Any]:
@@ -2277,20 +2632,17 @@ async def get_user_profile_details(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        result = await client.get_profile_details(profile_key=profile_key)
-
-        return {
-            "status": "success",
-            "profile": result,
-        }
+    client = get_client()
+    result = await client.get_profile_details(profile_key=profile_key)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "profile": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def update_user_profile(
     profile_key: str,
     settings: Dict[str, Any],
@@ -2313,25 +2665,22 @@ async def update_user_profile(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        result = await client.update_profile(
-            profile_key=profile_key,
-            settings=settings,
-        )
-
-        return {
-            "status": "success",
-            "profile_key": profile_key,
-            "updated": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.update_profile(
+        profile_key=profile_key,
+        settings=settings,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "profile_key": profile_key,
+        "updated": True,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def delete_user_profile(
     profile_key: str,
 ) -> Dict[str, Any]:
@@ -2352,24 +2701,21 @@ async def delete_user_profile(
 
     Note: Requires Ayrshare Business Plan
     """
-    try:
-        client = get_client()
-        result = await client.delete_profile(profile_key=profile_key)
-
-        return {
-            "status": "success",
-            "profile_key": profile_key,
-            "deleted": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.delete_profile(profile_key=profile_key)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "profile_key": profile_key,
+        "deleted": True,
+        "result": result,
+    }
 
 
 # History API Tools (Extended)
 
 @mcp.tool()
+@ayrshare_tool
 async def get_post_by_history_id(
     history_id: str,
 ) -> Dict[str, Any]:
@@ -2385,20 +2731,17 @@ async def get_post_by_history_id(
     Example:
         get_post_by_history_id(history_id="eIT96IYEodNuzU4oMmwG")
     """
-    try:
-        client = get_client()
-        result = await client.get_history_by_id(history_id=history_id)
-
-        return {
-            "status": "success",
-            "post": result,
-        }
+    client = get_client()
+    result = await client.get_history_by_id(history_id=history_id)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "post": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_all_scheduled_posts() -> Dict[str, Any]:
     """
     Get all scheduled posts
@@ -2411,21 +2754,18 @@ async def get_all_scheduled_posts() -> Dict[str, Any]:
     Example:
         get_all_scheduled_posts()
     """
-    try:
-        client = get_client()
-        posts = await client.get_scheduled_posts()
-
-        return {
-            "status": "success",
-            "total_scheduled": len(posts),
-            "posts": posts,
-        }
+    client = get_client()
+    posts = await client.get_scheduled_posts()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "total_scheduled": len(posts),
+        "posts": posts,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_repost_series(
     auto_repost_id: str,
 ) -> Dict[str, Any]:
@@ -2443,24 +2783,21 @@ async def get_repost_series(
     Example:
         get_repost_series(auto_repost_id="F5wdoaOAAGtDQVciExSxL")
     """
-    try:
-        client = get_client()
-        posts = await client.get_auto_repost_series(auto_repost_id=auto_repost_id)
-
-        return {
-            "status": "success",
-            "auto_repost_id": auto_repost_id,
-            "total_posts": len(posts),
-            "posts": posts,
-        }
+    client = get_client()
+    posts = await client.get_auto_repost_series(auto_repost_id=auto_repost_id)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "auto_repost_id": auto_repost_id,
+        "total_posts": len(posts),
+        "posts": posts,
+    }
 
 
 # Media API Tools (Extended)
 
 @mcp.tool()
+@ayrshare_tool
 async def list_all_media(
     limit: Optional[int] = None,
 ) -> Dict[str, Any]:
@@ -2478,21 +2815,18 @@ async def list_all_media(
     Example:
         list_all_media(limit=50)
     """
-    try:
-        client = get_client()
-        media = await client.list_media(limit=limit)
-
-        return {
-            "status": "success",
-            "total_media": len(media),
-            "media": media,
-        }
+    client = get_client()
+    media = await client.list_media(limit=limit)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "total_media": len(media),
+        "media": media,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_media_item_details(
     media_id: str,
 ) -> Dict[str, Any]:
@@ -2508,20 +2842,17 @@ async def get_media_item_details(
     Example:
         get_media_item_details(media_id="media_12345")
     """
-    try:
-        client = get_client()
-        result = await client.get_media_details(media_id=media_id)
-
-        return {
-            "status": "success",
-            "media": result,
-        }
+    client = get_client()
+    result = await client.get_media_details(media_id=media_id)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "media": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def delete_media_file(
     media_id: str,
 ) -> Dict[str, Any]:
@@ -2537,24 +2868,21 @@ async def delete_media_file(
     Example:
         delete_media_file(media_id="media_12345")
     """
-    try:
-        client = get_client()
-        result = await client.delete_media(media_id=media_id)
-
-        return {
-            "status": "success",
-            "media_id": media_id,
-            "deleted": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.delete_media(media_id=media_id)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "media_id": media_id,
+        "deleted": True,
+        "result": result,
+    }
 
 
 # Auto Schedule API Tools
 
 @mcp.tool()
+@ayrshare_tool
 async def setup_auto_schedule(
     schedule_config: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -2579,21 +2907,18 @@ async def setup_auto_schedule(
             }
         )
     """
-    try:
-        client = get_client()
-        result = await client.set_auto_schedule(schedule_config=schedule_config)
-
-        return {
-            "status": "success",
-            "schedule_created": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.set_auto_schedule(schedule_config=schedule_config)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "schedule_created": True,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_current_auto_schedule() -> Dict[str, Any]:
     """
     Get current auto-schedule configuration
@@ -2606,20 +2931,17 @@ async def get_current_auto_schedule() -> Dict[str, Any]:
     Example:
         get_current_auto_schedule()
     """
-    try:
-        client = get_client()
-        result = await client.get_auto_schedule()
-
-        return {
-            "status": "success",
-            "schedule": result,
-        }
+    client = get_client()
+    result = await client.get_auto_schedule()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "schedule": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def modify_auto_schedule(
     schedule_config: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -2639,22 +2961,19 @@ async def modify_auto_schedule(
                 "platforms": ["facebook", "instagram"]
             }
         )
-    """
-    try:
-        client = get_client()
-        result = await client.update_auto_schedule(schedule_config=schedule_config)
-
-        return {
-            "status": "success",
-            "schedule_updated": True,
-            "result": result,
-        }
+    """
+    client = get_client()
+    result = await client.update_auto_schedule(schedule_config=schedule_config)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "schedule_updated": True,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def remove_auto_schedule() -> Dict[str, Any]:
     """
     Remove auto-schedule
@@ -2667,23 +2986,20 @@ async def remove_auto_schedule() -> Dict[str, Any]:
     Example:
         remove_auto_schedule()
     """
-    try:
-        client = get_client()
-        result = await client.delete_auto_schedule()
-
-        return {
-            "status": "success",
-            "schedule_removed": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.delete_auto_schedule()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "schedule_removed": True,
+        "result": result,
+    }
 
 
 # Brand API Tools
 
 @mcp.tool()
+@ayrshare_tool
 async def create_brand_profile_config(
     brand_data: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -2711,21 +3027,18 @@ async def create_brand_profile_config(
             }
         )
     """
-    try:
-        client = get_client()
-        result = await client.create_brand_profile(brand_data=brand_data)
-
-        return {
-            "status": "success",
-            "brand_created": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.create_brand_profile(brand_data=brand_data)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "brand_created": True,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_brand_profile_assets() -> Dict[str, Any]:
     """
     Get brand assets and templates
@@ -2738,20 +3051,17 @@ async def get_brand_profile_assets() -> Dict[str, Any]:
     Example:
         get_brand_profile_assets()
     """
-    try:
-        client = get_client()
-        result = await client.get_brand_assets()
-
-        return {
-            "status": "success",
-            "brand": result,
-        }
+    client = get_client()
+    result = await client.get_brand_assets()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "brand": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def update_brand_profile_settings(
     brand_data: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -2773,23 +3083,20 @@ async def update_brand_profile_settings(
             }
         )
     """
-    try:
-        client = get_client()
-        result = await client.update_brand_settings(brand_data=brand_data)
-
-        return {
-            "status": "success",
-            "brand_updated": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.update_brand_settings(brand_data=brand_data)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "brand_updated": True,
+        "result": result,
+    }
 
 
 # Feed API Tools
 
 @mcp.tool()
+@ayrshare_tool
 async def get_platform_feed(
     platform: str,
     limit: Optional[int] = None,
@@ -2809,22 +3116,19 @@ async def get_platform_feed(
     Example:
         get_platform_feed(platform="instagram", limit=20)
     """
-    try:
-        client = get_client()
-        posts = await client.get_social_feed(platform=platform, limit=limit)
-
-        return {
-            "status": "success",
-            "platform": platform,
-            "total_posts": len(posts),
-            "posts": posts,
-        }
+    client = get_client()
+    posts = await client.get_social_feed(platform=platform, limit=limit)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "platform": platform,
+        "total_posts": len(posts),
+        "posts": posts,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_all_platform_feeds(
     limit: Optional[int] = None,
 ) -> Dict[str, Any]:
@@ -2842,22 +3146,19 @@ async def get_all_platform_feeds(
     Example:
         get_all_platform_feeds(limit=10)
     """
-    try:
-        client = get_client()
-        result = await client.get_all_feeds(limit=limit)
-
-        return {
-            "status": "success",
-            "feeds": result,
-        }
+    client = get_client()
+    result = await client.get_all_feeds(limit=limit)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "feeds": result,
+    }
 
 
 # Generate API Tools (Max Pack Add-on)
 
 @mcp.tool()
+@ayrshare_tool
 async def ai_generate_post_text(
     prompt: str,
     platform: Optional[str] = None,
@@ -2885,25 +3186,22 @@ async def ai_generate_post_text(
 
     Note: Requires Ayrshare Max Pack Add-on
     """
-    try:
-        client = get_client()
-        result = await client.generate_post_text(
-            prompt=prompt,
-            platform=platform,
-            tone=tone,
-        )
-
-        return {
-            "status": "success",
-            "generated_text": result.get("text"),
-            "result": result,
-        }
+    client = get_client()
+    result = await client.generate_post_text(
+        prompt=prompt,
+        platform=platform,
+        tone=tone,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "generated_text": result.get("text"),
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def ai_generate_hashtags_for_content(
     content: str,
     count: Optional[int] = None,
@@ -2926,21 +3224,18 @@ async def ai_generate_hashtags_for_content(
 
     Note: Requires Ayrshare Max Pack Add-on
     """
-    try:
-        client = get_client()
-        result = await client.generate_hashtags(content=content, count=count)
-
-        return {
-            "status": "success",
-            "hashtags": result.get("hashtags"),
-            "result": result,
-        }
+    client = get_client()
+    result = await client.generate_hashtags(content=content, count=count)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "hashtags": result.get("hashtags"),
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def ai_generate_image_caption(
     image_url: str,
     style: Optional[str] = None,
@@ -2963,23 +3258,20 @@ async def ai_generate_image_caption(
 
     Note: Requires Ayrshare Max Pack Add-on
     """
-    try:
-        client = get_client()
-        result = await client.generate_caption(image_url=image_url, style=style)
-
-        return {
-            "status": "success",
-            "caption": result.get("caption"),
-            "result": result,
-        }
+    client = get_client()
+    result = await client.generate_caption(image_url=image_url, style=style)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "caption": result.get("caption"),
+        "result": result,
+    }
 
 
 # Hashtags API Tools
 
 @mcp.tool()
+@ayrshare_tool
 async def suggest_relevant_hashtags(
     content: str,
     platform: Optional[str] = None,
@@ -3002,21 +3294,18 @@ async def suggest_relevant_hashtags(
             platform="instagram"
         )
     """
-    try:
-        client = get_client()
-        hashtags = await client.suggest_hashtags(content=content, platform=platform)
-
-        return {
-            "status": "success",
-            "hashtags": hashtags,
-            "total_suggestions": len(hashtags),
-        }
+    client = get_client()
+    hashtags = await client.suggest_hashtags(content=content, platform=platform)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "hashtags": hashtags,
+        "total_suggestions": len(hashtags),
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_trending_platform_hashtags(
     platform: str,
     region: Optional[str] = None,
@@ -3036,23 +3325,20 @@ async def get_trending_platform_hashtags(
     Example:
         get_trending_platform_hashtags(platform="twitter", region="US")
     """
-    try:
-        client = get_client()
-        hashtags = await client.get_trending_hashtags(platform=platform, region=region)
-
-        return {
-            "status": "success",
-            "platform": platform,
-            "region": region or "global",
-            "trending_hashtags": hashtags,
-            "total_trending": len(hashtags),
-        }
+    client = get_client()
+    hashtags = await client.get_trending_hashtags(platform=platform, region=region)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "platform": platform,
+        "region": region or "global",
+        "trending_hashtags": hashtags,
+        "total_trending": len(hashtags),
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def analyze_hashtag_metrics(
     hashtag: str,
     time_range: Optional[str] = None,
@@ -3072,27 +3358,24 @@ async def analyze_hashtag_metrics(
     Example:
         analyze_hashtag_metrics(hashtag="#marketing", time_range="30d")
     """
-    try:
-        client = get_client()
-        result = await client.analyze_hashtag_performance(
-            hashtag=hashtag,
-            time_range=time_range,
-        )
-
-        return {
-            "status": "success",
-            "hashtag": hashtag,
-            "time_range": time_range or "default",
-            "analytics": result,
-        }
+    client = get_client()
+    result = await client.analyze_hashtag_performance(
+        hashtag=hashtag,
+        time_range=time_range,
+    )
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "hashtag": hashtag,
+        "time_range": time_range or "default",
+        "analytics": result,
+    }
 
 
 # User API Tools
 
 @mcp.tool()
+@ayrshare_tool
 async def get_account_information() -> Dict[str, Any]:
     """
     Get user account information
@@ -3105,20 +3388,17 @@ async def get_account_information() -> Dict[str, Any]:
     Example:
         get_account_information()
     """
-    try:
-        client = get_client()
-        result = await client.get_user_info()
-
-        return {
-            "status": "success",
-            "account": result,
-        }
+    client = get_client()
+    result = await client.get_user_info()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "account": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def update_account_settings(
     settings: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -3139,21 +3419,18 @@ async def update_account_settings(
             }
         )
     """
-    try:
-        client = get_client()
-        result = await client.update_user_settings(settings=settings)
-
-        return {
-            "status": "success",
-            "settings_updated": True,
-            "result": result,
-        }
+    client = get_client()
+    result = await client.update_user_settings(settings=settings)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "settings_updated": True,
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def get_api_usage_limits() -> Dict[str, Any]:
     """
     Get API usage limits and current usage
@@ -3166,22 +3443,19 @@ async def get_api_usage_limits() -> Dict[str, Any]:
     Example:
         get_api_usage_limits()
     """
-    try:
-        client = get_client()
-        result = await client.get_api_limits()
-
-        return {
-            "status": "success",
-            "limits": result,
-        }
+    client = get_client()
+    result = await client.get_api_limits()
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "limits": result,
+    }
 
 
 # Utils API Tools
 
 @mcp.tool()
+@ayrshare_tool
 async def verify_media_accessibility(
     url: str,
 ) -> Dict[str, Any]:
@@ -3200,23 +3474,20 @@ async def verify_media_accessibility(
     Example:
         verify_media_accessibility(url="https://example.com/image.jpg")
     """
-    try:
-        client = get_client()
-        result = await client.verify_media_url(url=url)
-
-        return {
-            "status": "success",
-            "url": url,
-            "valid": result.get("valid", True),
-            "issues": result.get("issues", []),
-            "details": result,
-        }
+    client = get_client()
+    result = await client.verify_media_url(url=url)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "url": url,
+        "valid": result.get("valid", True),
+        "issues": result.get("issues", []),
+        "details": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def list_available_timezones() -> Dict[str, Any]:
     """
     Get list of available timezones
@@ -3229,21 +3500,32 @@ async def list_available_timezones() -> Dict[str, Any]:
     Example:
         list_available_timezones()
     """
-    try:
-        client = get_client()
-        timezones = await client.get_timezones()
+    client = get_client()
+    timezones = await client.get_timezones()
 
-        return {
-            "status": "success",
-            "total_timezones": len(timezones),
-            "timezones": timezones,
-        }
+    return {
+        "status": "success",
+        "total_timezones": len(timezones),
+        "timezones": timezones,
+    }
+
+
+# IANA zone names known to the local tzdata, built on first use (the
+# available_timezones() directory scan isn't worth paying at import).
+# Conversions between known zones are pure datetime arithmetic, so they
+# run locally; unknown aliases are delegated to the API.
+_TZ_SET: Optional[frozenset] = None
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+
+def _known_timezone(name: str) -> bool:
+    global _TZ_SET
+    if _TZ_SET is None:
+        _TZ_SET = frozenset(available_timezones())
+    return name in _TZ_SET
 
 
 @mcp.tool()
+@ayrshare_tool
 async def convert_time_between_timezones(
     time: str,
     from_tz: str,
@@ -3269,26 +3551,44 @@ async def convert_time_between_timezones(
             to_tz="Europe/London"
         )
     """
-    try:
-        client = get_client()
-        result = await client.convert_timezone(time=time, from_tz=from_tz, to_tz=to_tz)
+    # Both zones known locally: the conversion is pure datetime arithmetic,
+    # so skip the API round trip entirely. Unknown aliases and unparseable
+    # times fall through to the API, which stays the authority on those.
+    if _known_timezone(from_tz) and _known_timezone(to_tz):
+        try:
+            dt = datetime.fromisoformat(time.replace("Z", "+00:00"))
+        except ValueError:
+            dt = None
+        if dt is not None:
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=ZoneInfo(from_tz))
+            converted = dt.astimezone(ZoneInfo(to_tz)).isoformat()
+            return {
+                "status": "success",
+                "original_time": time,
+                "from_timezone": from_tz,
+                "to_timezone": to_tz,
+                "converted_time": converted,
+                "result": {"convertedTime": converted},
+            }
 
-        return {
-            "status": "success",
-            "original_time": time,
-            "from_timezone": from_tz,
-            "to_timezone": to_tz,
-            "converted_time": result.get("convertedTime"),
-            "result": result,
-        }
+    client = get_client()
+    result = await client.convert_timezone(time=time, from_tz=from_tz, to_tz=to_tz)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "original_time": time,
+        "from_timezone": from_tz,
+        "to_timezone": to_tz,
+        "converted_time": result.get("convertedTime"),
+        "result": result,
+    }
 
 
 # Validate API Tools
 
 @mcp.tool()
+@ayrshare_tool
 async def validate_post_before_publishing(
     post_data: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -3312,23 +3612,20 @@ async def validate_post_before_publishing(
             }
         )
     """
-    try:
-        client = get_client()
-        result = await client.validate_post(post_data=post_data)
-
-        return {
-            "status": "success",
-            "valid": result.get("valid", True),
-            "issues": result.get("issues", []),
-            "warnings": result.get("warnings", []),
-            "result": result,
-        }
+    client = get_client()
+    result = await client.validate_post(post_data=post_data)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "valid": result.get("valid", True),
+        "issues": result.get("issues", []),
+        "warnings": result.get("warnings", []),
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def validate_media_for_platform(
     media_url: str,
     platform: str,
@@ -3351,24 +3648,21 @@ async def validate_media_for_platform(
             platform="instagram"
         )
     """
-    try:
-        client = get_client()
-        result = await client.validate_media(media_url=media_url, platform=platform)
-
-        return {
-            "status": "success",
-            "media_url": media_url,
-            "platform": platform,
-            "valid": result.get("valid", True),
-            "issues": result.get("issues", []),
-            "result": result,
-        }
+    client = get_client()
+    result = await client.validate_media(media_url=media_url, platform=platform)
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "media_url": media_url,
+        "platform": platform,
+        "valid": result.get("valid", True),
+        "issues": result.get("issues", []),
+        "result": result,
+    }
 
 
 @mcp.tool()
+@ayrshare_tool
 async def validate_schedule_datetime(
     schedule_date: str,
     platform: str,
@@ -3391,24 +3685,100 @@ async def validate_schedule_datetime(
             platform="facebook"
         )
     """
-    try:
-        client = get_client()
-        result = await client.validate_schedule_time(
-            schedule_date=schedule_date,
-            platform=platform,
-        )
-
+    # Obvious format failures are caught locally before spending a round
+    # trip; the API still owns platform-specific scheduling rules.
+    error = _validate_scheduled_date(schedule_date)
+    if error is not None:
         return {
             "status": "success",
             "schedule_date": schedule_date,
             "platform": platform,
-            "valid": result.get("valid", True),
-            "issues": result.get("issues", []),
-            "result": result,
+            "valid": False,
+            "issues": [error["message"]],
+            "result": {"valid": False},
         }
 
-    except AyrshareError as e:
-        return {"status": "error", "message": str(e)}
+    client = get_client()
+    result = await client.validate_schedule_time(
+        schedule_date=schedule_date,
+        platform=platform,
+    )
+
+    return {
+        "status": "success",
+        "schedule_date": schedule_date,
+        "platform": platform,
+        "valid": result.get("valid", True),
+        "issues": result.get("issues", []),
+        "result": result,
+    }
+
+
+@mcp.tool()
+@ayrshare_tool
+async def validate_post_full(
+    post_data: Dict[str, Any],
+    media_url: Optional[str] = None,
+    platform: Optional[str] = None,
+    schedule_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run all pre-publish validations concurrently
+
+    Combines validate_post_before_publishing, validate_media_for_platform
+    and validate_schedule_datetime into one call: the applicable checks run
+    in parallel, so a full pre-flight costs one round-trip time instead of
+    three sequential tool calls.
+
+    Args:
+        post_data: Post data to validate (post, platforms, mediaUrls, etc.)
+        media_url: Optional media URL to validate (requires platform)
+        platform: Target platform for the media and schedule checks
+        schedule_date: Optional schedule date in ISO 8601 format
+                      (requires platform)
+
+    Returns:
+        Dictionary with the overall verdict, combined issues, and the
+        per-check results under "checks"
+
+    Example:
+        validate_post_full(
+            post_data={"post": "Launch day!", "platforms": ["instagram"]},
+            media_url="https://example.com/launch.mp4",
+            platform="instagram",
+            schedule_date="2025-12-25T10:00:00Z"
+        )
+    """
+    client = get_client()
+    tasks = {"post": client.validate_post(post_data=post_data)}
+    if media_url and platform:
+        tasks["media"] = client.validate_media(media_url=media_url, platform=platform)
+    if schedule_date and platform:
+        tasks["schedule"] = client.validate_schedule_time(
+            schedule_date=schedule_date, platform=platform
+        )
+
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    checks = {}
+    issues = []
+    valid = True
+    for name, result in zip(tasks, results):
+        if isinstance(result, BaseException):
+            checks[name] = {"error": str(result)}
+            valid = False
+        else:
+            checks[name] = result
+            if not result.get("valid", True):
+                valid = False
+            issues.extend(result.get("issues") or [])
+
+    return {
+        "status": "success",
+        "valid": valid,
+        "issues": issues,
+        "checks": checks,
+    }
 
 
 # ============================================================================
@@ -3416,6 +3786,19 @@ async def validate_schedule_datetime(
 # ============================================================================
 
 
+# Status -> tally bucket (0=successful, 1=failed, 2=scheduled): one hash
+# lookup per post replaces the chain of up to five string comparisons.
+_STATUS_BUCKET = {"success": 0, "error": 1, "failed": 1, "scheduled": 2, "pending": 2}
+
+# Rendered dashboards are cached per period — polled dashboards re-read the
+# same report far more often than a day's numbers move, and the freshness
+# budget scales with the window (yesterday's post barely shifts a 90-day
+# report). Entries remember their client (tests swap it) and are dropped by
+# _invalidate_history_cache whenever a tool mutates posts.
+_DASHBOARD_TTL = {"daily": 60.0, "weekly": 300.0, "monthly": 1800.0, "quarterly": 1800.0}
+_dashboard_cache: Dict[str, tuple] = {}  # period -> (client, monotonic timestamp, text)
+
+
 @mcp.resource("ayrshare://analytics/dashboard/{period}")
 async def get_analytics_dashboard(period: str) -> str:
     """
@@ -3442,28 +3825,36 @@ async def get_analytics_dashboard(period: str) -> str:
         days = period_days.get(period, 7)
 
         client = get_client()
+        cached = _dashboard_cache.get(period)
+        if (
+            cached is not None
+            and cached[0] is client
+            and time.monotonic() - cached[1] < _DASHBOARD_TTL.get(period, 300.0)
+        ):
+            return cached[2]
+
         history = await client.get_history(last_days=days)
 
         if not history:
             return f"No data available for {period} period."
 
-        # Aggregate metrics
+        # Aggregate metrics: one pass collects the status tallies and the
+        # per-platform counts together; the set of platforms used falls out
+        # of the count keys instead of a second traversal.
         total_posts = len(history)
-        platforms_used = set()
-        successful_posts = 0
-        failed_posts = 0
-        scheduled_posts = 0
+        status_counts = [0, 0, 0]
+        platform_counts: Counter = Counter()
 
         for post in history:
-            status = post.get("status", "")
-            if status == "success":
-                successful_posts += 1
-            elif status == "error" or status == "failed":
-                failed_posts += 1
-            elif status == "scheduled" or status == "pending":
-                scheduled_posts += 1
+            bucket = _STATUS_BUCKET.get(post.get("status", ""))
+            if bucket is not None:
+                status_counts[bucket] += 1
 
-            platforms_used.update(post.get("platforms", []))
+            # Counter.update runs the per-platform increments in C
+            platform_counts.update(post.get("platforms", ()))
+
+        successful_posts, failed_posts, scheduled_posts = status_counts
+        platforms_used = platform_counts.keys()
 
         # Build dashboard
         result = [
@@ -3482,15 +3873,10 @@ async def get_analytics_dashboard(period: str) -> str:
         ]
 
         # Top platforms
-        platform_counts = {}
-        for post in history:
-            for platform in post.get("platforms", []):
-                platform_counts[platform] = platform_counts.get(platform, 0) + 1
-
         if platform_counts:
             result.append("## Platform Breakdown")
-            sorted_platforms = sorted(platform_counts.items(), key=lambda x: x[1], reverse=True)
-            for platform, count in sorted_platforms[:5]:
+            # most_common(5) is a heap selection, O(n log 5) vs sorting
+            for platform, count in platform_counts.most_common(5):
                 percentage = (count / total_posts * 100) if total_posts > 0 else 0
                 result.append(f"- **{platform.title()}**: {count} posts ({percentage:.1f}%)")
             result.append("")
@@ -3500,7 +3886,9 @@ async def get_analytics_dashboard(period: str) -> str:
         for post in history[:5]:
             result.append(f"- {post.get('created', 'Unknown date')}: {post.get('status', 'unknown').title()} on {', '.join(post.get('platforms', []))}")
 
-        return "\n".join(result)
+        text = "\n".join(result)
+        _dashboard_cache[period] = (client, time.monotonic(), text)
+        return text
 
     except AyrshareError as e:
         return f"Error fetching analytics dashboard: {str(e)}"
@@ -7,6 +7,13 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+@pytest.fixture(autouse=True)
+def _no_media_probe(monkeypatch):
+    """Keep validate_media_url's local HEAD probe off the network in tests."""
+    from src import server
+    monkeypatch.setattr(server, "_MEDIA_PROBE_ENABLED", False)
+
+
 @pytest.fixture
 def api_key():
     """Get API key from environment."""
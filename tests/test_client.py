@@ -81,6 +81,7 @@ class TestAyrshareClientRequests:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.text = '{"result": "success"}'
+            mock_response.content = b'{"result": "success"}'
             mock_response.json.return_value = {"result": "success"}
             mock_request.return_value = mock_response
 
@@ -111,6 +112,7 @@ class TestAyrshareClientRequests:
             mock_response = MagicMock()
             mock_response.status_code = 400
             mock_response.text = '{"message": "Missing required field"}'
+            mock_response.content = b'{"message": "Missing required field"}'
             mock_response.json.return_value = {"message": "Missing required field"}
             mock_request.return_value = mock_response
 
@@ -128,6 +130,7 @@ class TestAyrshareClientRequests:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_response.text = '{"message": "Internal server error"}'
+            mock_response.content = b'{"message": "Internal server error"}'
             mock_response.json.return_value = {"message": "Internal server error"}
             mock_request.return_value = mock_response
 
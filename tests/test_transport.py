@@ -0,0 +1,192 @@
+"""
+Tests for AyrshareClient transport behavior
+
+Exercises the request machinery against httpx.MockTransport:
+- Retry/backoff on transient 429/5xx responses (honoring Retry-After)
+- TTL response caching and single-flight coalescing
+- ETag revalidation (304 served from the stored response)
+- Streaming history iteration
+- The token-bucket RateLimiter
+"""
+
+import asyncio
+
+import pytest
+import httpx
+import orjson
+
+from src.ayrshare_client import AyrshareClient, AyrshareError
+from src.production_config import RateLimiter
+
+
+def make_client(handler) -> AyrshareClient:
+    """Client whose HTTP layer is a MockTransport running `handler`"""
+    client = AyrshareClient(api_key="test-key", cache_ttl=0, max_retries=2)
+    client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), headers=client._headers
+    )
+    return client
+
+
+@pytest.mark.client
+@pytest.mark.unit
+class TestRetries:
+    """Tests for the transient-error retry loop"""
+
+    async def test_retries_429_with_retry_after(self):
+        """A 429 with Retry-After is retried and the eventual 200 returned"""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"ok": True})
+
+        client = make_client(handler)
+        result = await client._request("GET", "/user")
+        assert result == {"ok": True}
+        assert len(attempts) == 2
+        await client.close()
+
+    async def test_persistent_500_raises_after_max_retries(self):
+        """A 5xx that never clears surfaces as AyrshareError, attempts bounded"""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(500, headers={"Retry-After": "0"}, json={"message": "down"})
+
+        client = make_client(handler)
+        with pytest.raises(AyrshareError):
+            await client._request("GET", "/user")
+        assert len(attempts) == 3  # initial try + max_retries
+        await client.close()
+
+    async def test_post_not_retried_by_default(self):
+        """POSTs are not retried unless retry_posts is opted in (double-post risk)"""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(500, headers={"Retry-After": "0"}, json={"message": "down"})
+
+        client = make_client(handler)
+        with pytest.raises(AyrshareError):
+            await client._request("POST", "/post", data={"post": "hi"})
+        assert len(attempts) == 1
+        await client.close()
+
+
+@pytest.mark.client
+@pytest.mark.unit
+class TestCaching:
+    """Tests for the TTL cache and single-flight coalescing"""
+
+    async def test_ttl_cache_serves_repeat_reads(self):
+        """A second identical read within the TTL does not hit the network"""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(200, json={"n": len(attempts)})
+
+        client = make_client(handler)
+        first = await client._cached_request("GET", "/user", ttl=60)
+        second = await client._cached_request("GET", "/user", ttl=60)
+        assert first == second == {"n": 1}
+        assert len(attempts) == 1
+
+        client.invalidate_cache("/user")
+        third = await client._cached_request("GET", "/user", ttl=60)
+        assert third == {"n": 2}
+        await client.close()
+
+    async def test_concurrent_identical_reads_coalesce(self):
+        """N concurrent identical reads share one in-flight request"""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        client = make_client(handler)
+        results = await asyncio.gather(
+            *(client._cached_request("GET", "/profiles", ttl=60) for _ in range(5))
+        )
+        assert all(r == {"ok": True} for r in results)
+        assert len(attempts) == 1
+        await client.close()
+
+
+@pytest.mark.client
+@pytest.mark.unit
+class TestConditionalRequests:
+    """Tests for ETag revalidation"""
+
+    async def test_304_served_from_stored_response(self):
+        """After a 200 with an ETag, the next call revalidates and a 304 reuses the body"""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                return httpx.Response(200, headers={"ETag": '"v1"'}, json={"user": "a"})
+            assert request.headers.get("If-None-Match") == '"v1"'
+            return httpx.Response(304)
+
+        client = make_client(handler)
+        first = await client._request("GET", "/user")
+        second = await client._request("GET", "/user")
+        assert first == second == {"user": "a"}
+        assert len(attempts) == 2
+        await client.close()
+
+
+@pytest.mark.client
+@pytest.mark.unit
+class TestStreamingHistory:
+    """Tests for the incremental /history iterator"""
+
+    async def test_iter_history_yields_posts(self):
+        body = orjson.dumps(
+            {"posts": [{"id": "p1", "status": "success"}, {"id": "p2", "status": "failed"}]}
+        )
+
+        def handler(request):
+            return httpx.Response(200, content=body)
+
+        client = make_client(handler)
+        posts = [post async for post in client.iter_history(last_days=7)]
+        assert [p["id"] for p in posts] == ["p1", "p2"]
+        await client.close()
+
+    async def test_iter_history_error_raises(self):
+        def handler(request):
+            return httpx.Response(400, json={"message": "bad request"})
+
+        client = make_client(handler)
+        with pytest.raises(AyrshareError):
+            async for _ in client.iter_history(last_days=7):
+                pass
+        await client.close()
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Tests for the token-bucket rate limiter"""
+
+    def test_denies_when_bucket_empty_and_refills(self):
+        limiter = RateLimiter()
+        limiter.minute_limit = 2
+        limiter.minute_tokens = 2.0
+
+        assert limiter.check_limit() == (True, None)
+        assert limiter.check_limit() == (True, None)
+        allowed, message = limiter.check_limit()
+        assert allowed is False
+        assert "per minute" in message
+
+        # A full refill window restores the bucket
+        limiter.last_refill -= 60.0
+        assert limiter.check_limit() == (True, None)